@@ -1,52 +1,91 @@
 import os
 import sys
-import json
 import csv
 import re
+import string
 from collections import defaultdict, Counter
 
+import ijson
+
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
+from src.json_io import dump_json, load_json
+
+# Patterns used by classify_token, compiled once instead of per token
+_RE_PUNCT = re.compile(r'^[^\w]+$')
+_RE_CURRENCY_POST = re.compile(r'^\d+[$£€]')
+_RE_MIX1 = re.compile(r'^.*\d+.*[a-zA-Z]+.*$')
+_RE_MIX2 = re.compile(r'^.*[a-zA-Z]+.*\d+.*$')
+
+# Separators allowed inside formatted numbers (e.g. 1,000.50 or 1817-18)
+_NUM_SEPARATORS = str.maketrans('', '', ',.-')
+_CURRENCY_SYMBOLS = frozenset('$£€')
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Case distribution bucket for each alphabetic subcategory
+_CASE_TYPES = {
+    'all_uppercase': 'all_uppercase',
+    'lowercase': 'all_lowercase',
+    'capitalized': 'capitalized',
+    'mixed_case': 'mixed_case',
+}
+
+
+def _has_letter(token):
+    """Return True if the token contains any alphabetic character."""
+    if token.isascii():
+        # Set intersection runs in C; no generator frame per token
+        return not _ASCII_LETTERS.isdisjoint(token)
+    return any(c.isalpha() for c in token)
+
 
 def classify_token(token):
     """Classify a token into a specific type.
     
+    Checks are ordered so the common cases (plain words, punctuation)
+    are decided first with cheap string methods; regexes are only used
+    for the rarer mixed tokens.
+    
     Returns:
         Tuple of (main_category, subcategory)
     """
+    # Pure alphabetic (normal words)
+    if token.isalpha():
+        if token.isupper():
+            return ('alphabetic', 'all_uppercase')
+        elif token.islower():
+            return ('alphabetic', 'lowercase')
+        elif token[0].isupper() and token[1:].islower():
+            return ('alphabetic', 'capitalized')
+        else:
+            return ('alphabetic', 'mixed_case')
+    
     # Pure punctuation
-    if re.match(r'^[^\w]+$', token):
+    if _RE_PUNCT.match(token):
         return ('punctuation', 'symbol_only')
     
     # Pure numbers
-    if re.match(r'^\d+$', token):
+    if token.isdecimal():
         return ('numeric', 'integer')
     
-    # Decimal/formatted numbers
-    if re.match(r'^[\d,.\-]+$', token):
+    # Decimal/formatted numbers (separator-only tokens are punctuation above)
+    if token.translate(_NUM_SEPARATORS).isdecimal():
         return ('numeric', 'formatted_number')
     
     # Currency/financial
-    if re.match(r'^[$£€]\d+', token) or re.match(r'^\d+[$£€]', token):
+    first = token[:1]
+    if ((first in _CURRENCY_SYMBOLS and token[1:2].isdecimal())
+            or (first.isdecimal() and _RE_CURRENCY_POST.match(token))):
         return ('numeric', 'currency')
     
-    # Pure alphabetic (normal words)
-    if token.isalpha():
-        if token.isupper():
-            return ('alphabetic', 'all_uppercase')
-        elif token[0].isupper():
-            return ('alphabetic', 'capitalized')
-        else:
-            return ('alphabetic', 'lowercase')
-    
     # Mixed alphanumeric
-    if re.match(r'^.*\d+.*[a-zA-Z]+.*$', token) or re.match(r'^.*[a-zA-Z]+.*\d+.*$', token):
+    if _RE_MIX1.match(token) or _RE_MIX2.match(token):
         return ('mixed', 'alphanumeric')
     
     # Hyphenated words (has letters and hyphen)
-    if '-' in token and any(c.isalpha() for c in token):
+    if '-' in token and _has_letter(token):
         return ('compound', 'hyphenated')
     
     # Possessives
@@ -54,7 +93,7 @@ def classify_token(token):
         return ('grammatical', 'possessive')
     
     # Contractions
-    if "'" in token and any(c.isalpha() for c in token):
+    if "'" in token and _has_letter(token):
         return ('grammatical', 'contraction')
     
     # URLs/emails
@@ -65,20 +104,35 @@ def classify_token(token):
     return ('other', 'unclassified')
 
 
+def load_not_found_words(dict_results_path):
+    """Load the set of words not found in the dictionary.
+    
+    Prefers the one-word-per-line <results name>.not_found.txt that
+    check_dictionary.py writes for its results file, falling back to the
+    (much slower to parse) JSON results file if it is missing or older
+    than the results.
+    """
+    words_path = os.path.splitext(dict_results_path)[0] + '.not_found.txt'
+    
+    if (os.path.exists(words_path)
+            and os.path.getmtime(words_path) >= os.path.getmtime(dict_results_path)):
+        print(f"Loading unknown words from: {words_path}")
+        with open(words_path, 'r', encoding='utf-8') as f:
+            return frozenset(f.read().splitlines())
+    
+    print(f"Loading dictionary results from: {dict_results_path}")
+    dict_results = load_json(dict_results_path)
+    return frozenset(dict_results['summary']['all_not_found_words'])
+
+
 def analyze_all_tokens(tokenized_json_path, dict_results_path):
     """Analyze all tokens from the tokenized data."""
     
     print(f"Loading tokenized data from: {tokenized_json_path}")
-    with open(tokenized_json_path, 'r', encoding='utf-8') as f:
-        tokenized_data = json.load(f)
-    
-    print(f"Loading dictionary results from: {dict_results_path}")
-    with open(dict_results_path, 'r', encoding='utf-8') as f:
-        dict_results = json.load(f)
     
     # Create sets for quick lookup
     found_words = set()
-    not_found_words = set(dict_results['summary']['all_not_found_words'])
+    not_found_words = load_not_found_words(dict_results_path)
     
     # Statistics collectors
     token_type_counts = defaultdict(int)
@@ -96,59 +150,60 @@ def analyze_all_tokens(tokenized_json_path, dict_results_path):
     # Case sensitivity analysis
     case_distribution = defaultdict(int)
     
-    print(f"\nProcessing {tokenized_data['total_files']} files...")
+    print("\nProcessing files...")
     
-    all_tokens = []
-    file_count = 0
+    # Stream the files one at a time and count their tokens, rather than
+    # loading every token list or concatenating them into one corpus-sized
+    # list; the file total is counted along the way
+    token_counts = Counter()
+    total_tokens = 0
+    total_files = 0
     
-    for filename, file_data in tokenized_data['files'].items():
-        file_count += 1
-        tokens = file_data['tokens']
-        all_tokens.extend(tokens)
-        
-        if file_count % 500 == 0:
-            print(f"  Processed {file_count}/{tokenized_data['total_files']} files...")
+    with open(tokenized_json_path, 'rb') as f:
+        for total_files, (_, file_data) in enumerate(ijson.kvitems(f, 'files'), 1):
+            tokens = file_data['tokens']
+            token_counts.update(tokens)
+            total_tokens += len(tokens)
+            
+            if total_files % 500 == 0:
+                print(f"  Processed {total_files} files...")
     
-    print(f"\nAnalyzing {len(all_tokens):,} total tokens...")
+    print(f"\nAnalyzing {total_tokens:,} total tokens...")
     
-    for token in all_tokens:
+    # Classify each distinct token once and weight by its occurrence count
+    for token, n in token_counts.items():
         # Classify token
         main_cat, sub_cat = classify_token(token)
-        token_type_counts[main_cat] += 1
-        token_subtype_counts[f"{main_cat}:{sub_cat}"] += 1
+        subtype_key = f"{main_cat}:{sub_cat}"
+        token_type_counts[main_cat] += n
+        token_subtype_counts[subtype_key] += n
         
         # Track unique tokens per category
-        category_unique[main_cat].add(token.lower())
+        token_lower = token.lower()
+        category_unique[main_cat].add(token_lower)
         
-        # Store examples (limited)
-        if len(category_examples[f"{main_cat}:{sub_cat}"]) < 20:
-            if token not in category_examples[f"{main_cat}:{sub_cat}"]:
-                category_examples[f"{main_cat}:{sub_cat}"].append(token)
+        # Store examples (limited); tokens are already distinct here
+        examples = category_examples[subtype_key]
+        if len(examples) < 20:
+            examples.append(token)
         
         # Length distribution
-        token_length_distribution[len(token)] += 1
+        token_length_distribution[len(token)] += n
         
         # Found vs not found
-        token_lower = token.lower()
         if token_lower in not_found_words:
-            not_found_by_type[main_cat] += 1
+            not_found_by_type[main_cat] += n
         else:
-            found_by_type[main_cat] += 1
+            found_by_type[main_cat] += n
         
-        # Case analysis for alphabetic tokens
-        if token.isalpha():
-            if token.isupper():
-                case_distribution['all_uppercase'] += 1
-            elif token.islower():
-                case_distribution['all_lowercase'] += 1
-            elif token[0].isupper() and token[1:].islower():
-                case_distribution['capitalized'] += 1
-            else:
-                case_distribution['mixed_case'] += 1
+        # Case analysis for alphabetic tokens (classify_token already
+        # determined the case as the alphabetic subcategory)
+        if main_cat == 'alphabetic':
+            case_distribution[_CASE_TYPES[sub_cat]] += n
     
     return {
-        'total_tokens': len(all_tokens),
-        'total_files': tokenized_data['total_files'],
+        'total_tokens': total_tokens,
+        'total_files': total_files,
         'type_counts': dict(token_type_counts),
         'subtype_counts': dict(token_subtype_counts),
         'length_distribution': dict(token_length_distribution),
@@ -157,18 +212,61 @@ def analyze_all_tokens(tokenized_json_path, dict_results_path):
         'found_by_type': dict(found_by_type),
         'not_found_by_type': dict(not_found_by_type),
         'case_distribution': dict(case_distribution),
-        'unique_tokens': len(set(t.lower() for t in all_tokens))
+        # Every lowercased token was added to exactly one category set
+        'unique_tokens': len(set().union(*category_unique.values()))
     }
 
 
+def summary_csv_paths(output_csv_path):
+    """Return the paths of the four CSV files written for a summary.
+    
+    Returns:
+        Tuple of (main, detailed, length_distribution, case_distribution) paths
+    """
+    base, ext = os.path.splitext(output_csv_path)
+    return (
+        output_csv_path,
+        f"{base}_detailed{ext}",
+        f"{base}_length_distribution{ext}",
+        f"{base}_case_distribution{ext}",
+    )
+
+
 def export_token_type_summary(analysis_data, output_csv_path):
     """Export token type analysis to CSV."""
     
     print(f"\nExporting token type summary to CSV...")
     
+    _, subtype_csv, length_csv, case_csv = summary_csv_paths(output_csv_path)
+    total_tokens = analysis_data['total_tokens']
+    
     # Main summary CSV
+    type_counts = analysis_data['type_counts']
+    unique_counts = analysis_data['category_unique_counts']
+    found_by_type = analysis_data['found_by_type']
+    not_found_by_type = analysis_data['not_found_by_type']
+    
+    rows = []
+    for token_type in sorted(type_counts):
+        count = type_counts[token_type]
+        found = found_by_type.get(token_type, 0)
+        not_found = not_found_by_type.get(token_type, 0)
+        
+        accuracy = (found / (found + not_found) * 100) if (found + not_found) > 0 else 0
+        
+        rows.append((
+            token_type.title(),
+            count,
+            round(count / total_tokens * 100, 2),
+            unique_counts.get(token_type, 0),
+            found,
+            not_found,
+            round(accuracy, 2)
+        ))
+    
     with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = [
+        writer = csv.writer(csvfile)
+        writer.writerow([
             'token_type',
             'token_count',
             'percentage',
@@ -176,103 +274,73 @@ def export_token_type_summary(analysis_data, output_csv_path):
             'found_in_dict',
             'not_found_in_dict',
             'accuracy_rate'
-        ]
-        
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        total_tokens = analysis_data['total_tokens']
-        
-        for token_type in sorted(analysis_data['type_counts'].keys()):
-            count = analysis_data['type_counts'][token_type]
-            unique_count = analysis_data['category_unique_counts'].get(token_type, 0)
-            found = analysis_data['found_by_type'].get(token_type, 0)
-            not_found = analysis_data['not_found_by_type'].get(token_type, 0)
-            
-            accuracy = (found / (found + not_found) * 100) if (found + not_found) > 0 else 0
-            
-            writer.writerow({
-                'token_type': token_type.title(),
-                'token_count': count,
-                'percentage': round(count / total_tokens * 100, 2),
-                'unique_count': unique_count,
-                'found_in_dict': found,
-                'not_found_in_dict': not_found,
-                'accuracy_rate': round(accuracy, 2)
-            })
-    
-    print(f"✓ Token type summary exported to: {output_csv_path}")
-    print(f"  File size: {os.path.getsize(output_csv_path):,} bytes")
+        ])
+        writer.writerows(rows)
     
     # Subtype detail CSV
-    subtype_csv = output_csv_path.replace('.csv', '_detailed.csv')
+    subtype_counts = analysis_data['subtype_counts']
+    category_examples = analysis_data['category_examples']
+    
+    rows = []
+    for subtype_key in sorted(subtype_counts):
+        main_type, subtype = subtype_key.split(':', 1)
+        count = subtype_counts[subtype_key]
+        rows.append((
+            main_type.title(),
+            subtype.replace('_', ' ').title(),
+            count,
+            round(count / total_tokens * 100, 2),
+            '; '.join(category_examples.get(subtype_key, [])[:10])
+        ))
+    
     with open(subtype_csv, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = [
+        writer = csv.writer(csvfile)
+        writer.writerow([
             'main_type',
             'subtype',
             'token_count',
             'percentage',
             'examples'
-        ]
-        
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        total_tokens = analysis_data['total_tokens']
-        
-        for subtype_key in sorted(analysis_data['subtype_counts'].keys()):
-            main_type, subtype = subtype_key.split(':', 1)
-            count = analysis_data['subtype_counts'][subtype_key]
-            examples = analysis_data['category_examples'].get(subtype_key, [])
-            
-            writer.writerow({
-                'main_type': main_type.title(),
-                'subtype': subtype.replace('_', ' ').title(),
-                'token_count': count,
-                'percentage': round(count / total_tokens * 100, 2),
-                'examples': '; '.join(examples[:10])
-            })
-    
-    print(f"✓ Detailed subtype analysis exported to: {subtype_csv}")
-    print(f"  File size: {os.path.getsize(subtype_csv):,} bytes")
+        ])
+        writer.writerows(rows)
     
     # Length distribution CSV
-    length_csv = output_csv_path.replace('.csv', '_length_distribution.csv')
+    length_distribution = analysis_data['length_distribution']
+    rows = [
+        (length, count, round(count / total_tokens * 100, 2))
+        for length, count in sorted(length_distribution.items())
+    ]
+    
     with open(length_csv, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['Token Length', 'Count', 'Percentage'])
-        
-        total_tokens = analysis_data['total_tokens']
-        
-        for length in sorted(analysis_data['length_distribution'].keys()):
-            count = analysis_data['length_distribution'][length]
-            writer.writerow([
-                length,
-                count,
-                round(count / total_tokens * 100, 2)
-            ])
-    
-    print(f"✓ Length distribution exported to: {length_csv}")
-    print(f"  File size: {os.path.getsize(length_csv):,} bytes")
+        writer.writerows(rows)
     
     # Case distribution CSV (for alphabetic tokens)
-    case_csv = output_csv_path.replace('.csv', '_case_distribution.csv')
+    case_distribution = analysis_data['case_distribution']
+    total_case_tokens = sum(case_distribution.values())
+    rows = [
+        (
+            case_type.replace('_', ' ').title(),
+            count,
+            round(count / total_case_tokens * 100, 2) if total_case_tokens > 0 else 0
+        )
+        for case_type, count in sorted(case_distribution.items())
+    ]
+    
     with open(case_csv, 'w', newline='', encoding='utf-8') as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['Case Type', 'Count', 'Percentage'])
-        
-        total_case_tokens = sum(analysis_data['case_distribution'].values())
-        
-        for case_type in sorted(analysis_data['case_distribution'].keys()):
-            count = analysis_data['case_distribution'][case_type]
-            writer.writerow([
-                case_type.replace('_', ' ').title(),
-                count,
-                round(count / total_case_tokens * 100, 2) if total_case_tokens > 0 else 0
-            ])
-    
-    print(f"✓ Case distribution exported to: {case_csv}")
-    print(f"  File size: {os.path.getsize(case_csv):,} bytes")
+        writer.writerows(rows)
+    
+    for label, path in (
+        ('Token type summary', output_csv_path),
+        ('Detailed subtype analysis', subtype_csv),
+        ('Length distribution', length_csv),
+        ('Case distribution', case_csv),
+    ):
+        print(f"✓ {label} exported to: {path}")
+        print(f"  File size: {os.path.getsize(path):,} bytes")
 
 
 def print_summary_report(analysis_data):
@@ -292,10 +360,11 @@ def print_summary_report(analysis_data):
     print("-"*80)
     
     total = analysis_data['total_tokens']
-    for token_type in sorted(analysis_data['type_counts'].keys(), 
-                            key=lambda x: analysis_data['type_counts'][x], 
-                            reverse=True):
-        count = analysis_data['type_counts'][token_type]
+    type_counts = analysis_data['type_counts']
+    sorted_types = sorted(type_counts, key=type_counts.__getitem__, reverse=True)
+    
+    for token_type in sorted_types:
+        count = type_counts[token_type]
         unique = analysis_data['category_unique_counts'].get(token_type, 0)
         pct = count / total * 100
         print(f"{token_type.title():<20} {count:<15,} {pct:<12.2f} {unique:<12,}")
@@ -306,7 +375,7 @@ def print_summary_report(analysis_data):
     print(f"{'Type':<20} {'Found':<15} {'Not Found':<15} {'Accuracy %':<12}")
     print("-"*80)
     
-    for token_type in sorted(analysis_data['type_counts'].keys()):
+    for token_type in sorted_types:
         found = analysis_data['found_by_type'].get(token_type, 0)
         not_found = analysis_data['not_found_by_type'].get(token_type, 0)
         total_type = found + not_found
@@ -318,10 +387,10 @@ def print_summary_report(analysis_data):
     print("CASE DISTRIBUTION (Alphabetic Tokens Only)")
     print("-"*80)
     
-    total_case = sum(analysis_data['case_distribution'].values())
-    for case_type, count in sorted(analysis_data['case_distribution'].items(), 
-                                   key=lambda x: x[1], 
-                                   reverse=True):
+    case_distribution = analysis_data['case_distribution']
+    total_case = sum(case_distribution.values())
+    for case_type in sorted(case_distribution, key=case_distribution.__getitem__, reverse=True):
+        count = case_distribution[case_type]
         pct = count / total_case * 100 if total_case > 0 else 0
         print(f"{case_type.replace('_', ' ').title():<20} {count:<15,} {pct:<12.2f}%")
     
@@ -329,11 +398,11 @@ def print_summary_report(analysis_data):
     print("TOP SUBTYPES")
     print("-"*80)
     
-    sorted_subtypes = sorted(analysis_data['subtype_counts'].items(), 
-                            key=lambda x: x[1], 
-                            reverse=True)[:15]
+    subtype_counts = analysis_data['subtype_counts']
+    sorted_subtypes = sorted(subtype_counts, key=subtype_counts.__getitem__, reverse=True)[:15]
     
-    for subtype_key, count in sorted_subtypes:
+    for subtype_key in sorted_subtypes:
+        count = subtype_counts[subtype_key]
         main_type, subtype = subtype_key.split(':', 1)
         pct = count / total * 100
         examples = analysis_data['category_examples'].get(subtype_key, [])
@@ -376,10 +445,9 @@ def main():
     
     # Save analysis to JSON
     print(f"\nSaving detailed analysis to: {analysis_json}")
-    with open(analysis_json, 'w', encoding='utf-8') as f:
-        # Don't save category_examples in JSON (too large), just counts
-        save_data = {k: v for k, v in analysis_data.items() if k != 'category_examples'}
-        json.dump(save_data, f, indent=2)
+    # Don't save category_examples in JSON (too large), just counts
+    save_data = {k: v for k, v in analysis_data.items() if k != 'category_examples'}
+    dump_json(save_data, analysis_json)
     print(f"  File size: {os.path.getsize(analysis_json):,} bytes")
     
     # Export to CSV
@@ -392,11 +460,8 @@ def main():
     print("ANALYSIS COMPLETE")
     print(f"{'='*80}")
     print(f"\nGenerated files:")
-    print(f"  1. {output_csv}")
-    print(f"  2. {output_csv.replace('.csv', '_detailed.csv')}")
-    print(f"  3. {output_csv.replace('.csv', '_length_distribution.csv')}")
-    print(f"  4. {output_csv.replace('.csv', '_case_distribution.csv')}")
-    print(f"  5. {analysis_json}")
+    for i, path in enumerate(summary_csv_paths(output_csv) + (analysis_json,), 1):
+        print(f"  {i}. {path}")
     print(f"\nAll files are ready to open in Excel for analysis.")
 
 
@@ -1,13 +1,31 @@
 import os
 import sys
-import json
 import re
+import string
 
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
 from src.dictionary_checker import check_tokenized_files
+from src.json_io import dump_json
+
+# Patterns used by categorize_unknown_words, compiled once instead of per word
+_RE_PUNCT = re.compile(r'^[^\w]+$')
+_RE_MIX1 = re.compile(r'^.*\d+.*[a-zA-Z]+.*$')
+_RE_MIX2 = re.compile(r'^.*[a-zA-Z]+.*\d+.*$')
+
+# Separators allowed inside numbers (e.g. 1,000.50 or 1817-18)
+_NUM_SEPARATORS = str.maketrans('', '', ',.-')
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+def _has_letter(token):
+    """Return True if the token contains any alphabetic character."""
+    if token.isascii():
+        # Set intersection runs in C; no generator frame per token
+        return not _ASCII_LETTERS.isdisjoint(token)
+    return any(c.isalpha() for c in token)
 
 
 def categorize_unknown_words(unknown_words):
@@ -23,18 +41,30 @@ def categorize_unknown_words(unknown_words):
         'other': []
     }
     
+    match_punct = _RE_PUNCT.match
+    match_mix1 = _RE_MIX1.match
+    match_mix2 = _RE_MIX2.match
+    
     for word in unknown_words:
+        # Letters only - none of the other categories can match, so decide
+        # the most common case first.  Potential real misspellings are
+        # longer than 2 chars.
+        if word.isalpha():
+            if len(word) > 2:
+                categories['potential_misspellings'].append(word)
+            else:
+                categories['other'].append(word)
         # Punctuation only
-        if re.match(r'^[^\w]+$', word):
+        elif match_punct(word):
             categories['punctuation'].append(word)
-        # Numbers only
-        elif re.match(r'^[\d,.\-]+$', word):
+        # Numbers only (separator-only words are punctuation above)
+        elif word.translate(_NUM_SEPARATORS).isdecimal():
             categories['numbers'].append(word)
         # Mixed alphanumeric
-        elif re.match(r'^.*\d+.*[a-zA-Z]+.*$', word) or re.match(r'^.*[a-zA-Z]+.*\d+.*$', word):
+        elif match_mix1(word) or match_mix2(word):
             categories['mixed_alphanumeric'].append(word)
         # Hyphenated words
-        elif '-' in word and any(c.isalpha() for c in word):
+        elif '-' in word and _has_letter(word):
             categories['hyphenated'].append(word)
         # Possessives (ends with 's)
         elif word.endswith("'s") or word.endswith("s'"):
@@ -42,9 +72,6 @@ def categorize_unknown_words(unknown_words):
         # Contractions
         elif "'" in word:
             categories['contractions'].append(word)
-        # Potential real misspellings (only letters, longer than 2 chars)
-        elif word.isalpha() and len(word) > 2:
-            categories['potential_misspellings'].append(word)
         else:
             categories['other'].append(word)
     
@@ -64,8 +91,10 @@ def main():
     print()
     
     # Run dictionary check WITH STEMMING (Snowball method) AND HYPHENATED HANDLING
+    # This is the only check running, so analyze files on every CPU
     results = check_tokenized_files(tokenized_path, db_path, output_path, 
-                                   use_stemming=True, stem_method='snowball')
+                                   use_stemming=True, stem_method='snowball',
+                                   max_workers=os.cpu_count() or 1)
     
     # Display summary
     print("\n" + "="*70)
@@ -147,10 +176,18 @@ def main():
         'category_counts': {k: len(v) for k, v in categories.items()}
     }
     
-    with open(analysis_path, 'w', encoding='utf-8') as f:
-        json.dump(analysis_data, f, indent=2)
+    dump_json(analysis_data, analysis_path)
     
     print(f"\nDetailed analysis saved to: {analysis_path}")
+    
+    # Save unknown words one per line; much cheaper for later scripts to
+    # load than the JSON list inside the results file. It is named after the
+    # results file so readers can tell which results it belongs to
+    words_path = os.path.splitext(output_path)[0] + '.not_found.txt'
+    with open(words_path, 'w', encoding='utf-8') as f:
+        f.writelines(f"{word}\n" for word in results['summary']['all_not_found_words'])
+    
+    print(f"Unknown words list saved to: {words_path}")
 
 
 if __name__ == '__main__':
@@ -1,44 +1,32 @@
 import os
 import sys
-import json
+import io
+import contextlib
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
 from src.dictionary_checker import check_tokenized_files
+from src.json_io import dump_json
 
 
-def main():
-    project_root = ROOT
+def _run_method(method, tokenized_path, db_path, output_path, max_workers):
+    """Run the dictionary check with one stemming method.
     
-    db_path = os.path.join(project_root, 'data', 'dictionary.db')
-    tokenized_path = os.path.join(project_root, 'data', 'tokenized_summary.json')
-    output_path = os.path.join(project_root, 'data', 'dictionary_check_results_stemmed.json')
+    Runs in a worker process, so console output is captured and returned
+    to be printed by the parent once all methods have finished.
     
-    print("="*70)
-    print("LEXICAL CHECKER - Dictionary Validation WITH STEMMING")
-    print("="*70)
-    print()
-    
-    # Check if input files exist
-    if not os.path.exists(tokenized_path):
-        print(f"Error: {tokenized_path} not found!")
-        print("Run tokenize_files.py first to generate tokenized data.")
-        return
+    Returns:
+        Tuple of (method, comparison stats or None on error, captured output)
+    """
+    output = io.StringIO()
+    stats = None
     
-    if not os.path.exists(db_path):
-        print(f"Error: {db_path} not found!")
-        print("Dictionary database missing.")
-        return
-    
-    # Run dictionary check WITH STEMMING
-    # Try different stemming methods to compare
-    methods = ['porter', 'snowball', 'lemmatize']
-    
-    results_comparison = {}
-    
-    for method in methods:
+    with contextlib.redirect_stdout(output):
         print(f"\n{'='*70}")
         print(f"Testing with {method.upper()} method")
         print(f"{'='*70}\n")
@@ -51,10 +39,11 @@ def main():
                 db_path, 
                 method_output_path,
                 use_stemming=True,
-                stem_method=method
+                stem_method=method,
+                max_workers=max_workers
             )
             
-            results_comparison[method] = {
+            stats = {
                 'original_found': results['summary']['total_found'],
                 'stem_found': results['summary']['total_stem_found'],
                 'combined_found': results['summary']['total_combined_found'],
@@ -83,8 +72,53 @@ def main():
             
         except Exception as e:
             print(f"Error with {method} method: {e}")
-            import traceback
-            traceback.print_exc()
+            traceback.print_exc(file=output)
+    
+    return method, stats, output.getvalue()
+
+
+def main():
+    project_root = ROOT
+    
+    db_path = os.path.join(project_root, 'data', 'dictionary.db')
+    tokenized_path = os.path.join(project_root, 'data', 'tokenized_summary.json')
+    output_path = os.path.join(project_root, 'data', 'dictionary_check_results_stemmed.json')
+    
+    print("="*70)
+    print("LEXICAL CHECKER - Dictionary Validation WITH STEMMING")
+    print("="*70)
+    print()
+    
+    # Check if input files exist
+    if not os.path.exists(tokenized_path):
+        print(f"Error: {tokenized_path} not found!")
+        print("Run tokenize_files.py first to generate tokenized data.")
+        return
+    
+    if not os.path.exists(db_path):
+        print(f"Error: {db_path} not found!")
+        print("Dictionary database missing.")
+        return
+    
+    # Run dictionary check WITH STEMMING
+    # Try different stemming methods to compare; each method is an
+    # independent full pass, so run them in parallel worker processes
+    methods = ['porter', 'snowball', 'lemmatize']
+    # Split the CPUs between the methods so each one's per-file workers
+    # don't oversubscribe the machine
+    workers_per_method = max(1, (os.cpu_count() or 1) // len(methods))
+    
+    results_comparison = {}
+    
+    with ProcessPoolExecutor(max_workers=len(methods)) as executor:
+        runs = list(executor.map(_run_method, methods, repeat(tokenized_path),
+                                 repeat(db_path), repeat(output_path),
+                                 repeat(workers_per_method)))
+    
+    for method, stats, output in runs:
+        print(output, end='')
+        if stats is not None:
+            results_comparison[method] = stats
     
     # Print comparison table
     if results_comparison:
@@ -110,8 +144,7 @@ def main():
         
         # Save comparison
         comparison_path = os.path.join(project_root, 'data', 'stemming_comparison.json')
-        with open(comparison_path, 'w', encoding='utf-8') as f:
-            json.dump(results_comparison, f, indent=2)
+        dump_json(results_comparison, comparison_path)
         print(f"\nComparison saved to: {comparison_path}")
 
 
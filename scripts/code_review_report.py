@@ -59,4 +59,10 @@ PERFORMANCE: ✓ GOOD
 OVERALL: PASSED WITH MINOR RECOMMENDATIONS
 """
 
-print(__doc__)
+
+def main():
+    print(__doc__)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,23 @@
 import os
 import sys
-import json
 import csv
+import re
+from operator import itemgetter
+
+import ijson
 
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
+from src.json_io import load_json
+
+# Write CSVs through a 1 MiB buffer instead of the 8 KiB default
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Result filenames look like 1817-01_486376978.txt (YYYY-MM_ID.txt)
+_FN_RE = re.compile(r'^(\d{4}-\d{2})_(\d+)\.txt$')
+
 
 def export_to_csv(results_json_path: str, output_csv_path: str):
     """Export dictionary check results to CSV format.
@@ -16,13 +27,56 @@ def export_to_csv(results_json_path: str, output_csv_path: str):
         output_csv_path: Path for output CSV file
     """
     print(f"Loading results from: {results_json_path}")
-    with open(results_json_path, 'r', encoding='utf-8') as f:
-        results = json.load(f)
     
-    print(f"Exporting {len(results['files'])} files to CSV...")
+    # Stream one file entry at a time, keeping only its finished CSV row. The
+    # summary block comes after the files, so its totals are added up here
+    # the same way check_tokenized_files computes them, instead of parsing
+    # the file a second time to reach it
+    rows = []
+    total_tokens = 0
+    total_found = 0
+    total_not_found = 0
+    unknown_words = set()
+    with open(results_json_path, 'rb') as f:
+        for filename, data in ijson.kvitems(f, 'files', use_float=True):
+            # Extract date and ID from filename (format: YYYY-MM_ID.txt),
+            # splitting on '_' for names in any other format
+            match = _FN_RE.match(filename)
+            if match:
+                date, article_id = match.groups()
+            else:
+                parts = filename.replace('.txt', '').split('_')
+                date = parts[0]
+                article_id = parts[1] if len(parts) > 1 else ''
+            
+            # Join unknown words with semicolon separator
+            not_found_tokens = data.get('not_found_tokens', [])
+            not_found_words = '; '.join(not_found_tokens)
+            unknown_words.update(not_found_tokens)
+            total_tokens += data['total_tokens']
+            total_found += data['found_count']
+            total_not_found += data['not_found_count']
+            
+            rows.append((
+                filename,
+                date,
+                article_id,
+                data['total_tokens'],
+                data['found_count'],
+                data['not_found_count'],
+                data['unique_found'],
+                data['unique_not_found'],
+                round(data['found_percentage'], 2),
+                not_found_words
+            ))
+    # Results follow tokenize_directory's filename order, so this sort is a
+    # single linear pass; it only does real work for older result files
+    rows.sort(key=itemgetter(0))
+    
+    print(f"Exporting {len(rows)} files to CSV...")
     
     # Write main results CSV
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
         fieldnames = [
             'filename',
             'date',
@@ -36,45 +90,26 @@ def export_to_csv(results_json_path: str, output_csv_path: str):
             'not_found_words'
         ]
         
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        
-        for filename, data in sorted(results['files'].items()):
-            # Extract date and ID from filename (format: YYYY-MM_ID.txt)
-            parts = filename.replace('.txt', '').split('_')
-            date = parts[0] if len(parts) > 0 else ''
-            article_id = parts[1] if len(parts) > 1 else ''
-            
-            # Join unknown words with semicolon separator
-            not_found_words = '; '.join(data.get('not_found_tokens', []))
-            
-            writer.writerow({
-                'filename': filename,
-                'date': date,
-                'article_id': article_id,
-                'total_tokens': data['total_tokens'],
-                'found_count': data['found_count'],
-                'not_found_count': data['not_found_count'],
-                'unique_found': data['unique_found'],
-                'unique_not_found': data['unique_not_found'],
-                'found_percentage': round(data['found_percentage'], 2),
-                'not_found_words': not_found_words
-            })
+        writer = csv.writer(csvfile)
+        writer.writerow(fieldnames)
+        writer.writerows(rows)
     
     print(f"✓ Main results exported to: {output_csv_path}")
     print(f"  File size: {os.path.getsize(output_csv_path):,} bytes")
     
     # Create summary CSV
+    checked = total_found + total_not_found
+    found_percentage = (total_found / checked * 100) if checked > 0 else 0
     summary_csv_path = output_csv_path.replace('.csv', '_summary.csv')
-    with open(summary_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(summary_csv_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['Metric', 'Value'])
-        writer.writerow(['Total Files', results['summary']['total_files']])
-        writer.writerow(['Total Tokens', results['summary']['total_tokens']])
-        writer.writerow(['Tokens Found in Dictionary', results['summary']['total_found']])
-        writer.writerow(['Tokens Not Found', results['summary']['total_not_found']])
-        writer.writerow(['Found Percentage', f"{results['summary']['found_percentage']:.2f}%"])
-        writer.writerow(['Unique Unknown Words', results['summary']['unique_not_found_words']])
+        writer.writerow(['Total Files', len(rows)])
+        writer.writerow(['Total Tokens', total_tokens])
+        writer.writerow(['Tokens Found in Dictionary', total_found])
+        writer.writerow(['Tokens Not Found', total_not_found])
+        writer.writerow(['Found Percentage', f"{found_percentage:.2f}%"])
+        writer.writerow(['Unique Unknown Words', len(unknown_words)])
     
     print(f"✓ Summary exported to: {summary_csv_path}")
     print(f"  File size: {os.path.getsize(summary_csv_path):,} bytes")
@@ -88,21 +123,15 @@ def export_unknown_words_to_csv(analysis_json_path: str, output_csv_path: str):
         output_csv_path: Path for output CSV file
     """
     print(f"\nLoading unknown words analysis from: {analysis_json_path}")
-    with open(analysis_json_path, 'r', encoding='utf-8') as f:
-        analysis = json.load(f)
+    analysis = load_json(analysis_json_path)
     
     # Export categorized words
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['word', 'category']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    with open(output_csv_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(['word', 'category'])
         
         for category, words in analysis['categories'].items():
-            for word in sorted(words):
-                writer.writerow({
-                    'word': word,
-                    'category': category
-                })
+            writer.writerows((word, category) for word in sorted(words))
     
     print(f"✓ Unknown words exported to: {output_csv_path}")
     print(f"  File size: {os.path.getsize(output_csv_path):,} bytes")
@@ -110,11 +139,13 @@ def export_unknown_words_to_csv(analysis_json_path: str, output_csv_path: str):
     
     # Export category counts
     category_csv_path = output_csv_path.replace('.csv', '_categories.csv')
-    with open(category_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(category_csv_path, 'w', newline='', encoding='utf-8', buffering=_CSV_BUFFER_SIZE) as csvfile:
         writer = csv.writer(csvfile)
         writer.writerow(['Category', 'Count'])
-        for category, count in sorted(analysis['category_counts'].items(), key=lambda x: x[1], reverse=True):
-            writer.writerow([category.replace('_', ' ').title(), count])
+        writer.writerows(
+            (category.replace('_', ' ').title(), count)
+            for category, count in sorted(analysis['category_counts'].items(), key=lambda x: x[1], reverse=True)
+        )
     
     print(f"✓ Category summary exported to: {category_csv_path}")
     print(f"  File size: {os.path.getsize(category_csv_path):,} bytes")
@@ -1,70 +1,119 @@
 import os
 import sys
-import json
-import csv
+import re
 from collections import defaultdict
 
+import ijson
+
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
+# Write CSVs through a 1 MiB buffer instead of the 8 KiB default
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Result filenames look like 1817-01_486376978.txt (YYYY-MM_ID.txt)
+_FN_RE = re.compile(r'^((\d{4})-\d{2})_(\d+)\.txt$')
+
+# Characters that make csv.writer quote a field
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
 
-def extract_year_from_filename(filename):
-    """Extract year from filename (format: YYYY-MM_ID.txt).
+def _periods_from_filename(filename):
+    """Get the (year, year_month) a result file is counted under.
     
-    Args:
-        filename: The filename to parse
-        
-    Returns:
-        Year as string (e.g., '1817') or 'Unknown'
+    Names in the expected format are matched with one regex; anything else
+    falls back to splitting on '-' and '_', so unusual names are grouped
+    the same way as before.
     """
-    try:
-        # Expected format: 1817-01_486376978.txt
-        parts = filename.split('-')
-        if len(parts) > 0 and parts[0].isdigit() and len(parts[0]) == 4:
-            return parts[0]
-    except:
-        pass
-    return 'Unknown'
+    match = _FN_RE.match(filename)
+    if match:
+        return match.group(2, 1)
+    
+    parts = filename.split('-')
+    year = parts[0] if parts[0].isdigit() and len(parts[0]) == 4 else 'Unknown'
+    date_part = filename.split('_')[0]
+    year_month = date_part if '-' in date_part else 'Unknown'
+    return year, year_month
 
 
-def generate_yearly_summary(results_json_path, output_csv_path):
-    """Generate a year-based summary report in CSV format.
+def _csv_field(value):
+    """Format one CSV field, quoting it when csv.writer would."""
+    text = str(value)
+    if _CSV_SPECIAL_RE.search(text):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _csv_line(fields):
+    """Format one CSV line of numbers and period labels.
     
-    Args:
-        results_json_path: Path to dictionary_check_results.json
-        output_csv_path: Path for output CSV file
+    Labels from unusual filenames may need quoting, so each field is
+    checked the way csv.writer would check it.
     """
-    print(f"Loading results from: {results_json_path}")
-    with open(results_json_path, 'r', encoding='utf-8') as f:
-        results = json.load(f)
-    
-    # Aggregate data by year
-    yearly_data = defaultdict(lambda: {
+    return ','.join(map(_csv_field, fields)) + '\r\n'
+
+
+def _new_period_totals():
+    """Empty aggregate for one year or year-month."""
+    return {
         'file_count': 0,
         'total_tokens': 0,
         'found_count': 0,
         'not_found_count': 0,
         'unique_not_found': set()
-    })
-    
-    print(f"Processing {len(results['files'])} files...")
+    }
+
+
+def aggregate_results(results_json_path):
+    """Aggregate per-file results by year and by year-month in one pass.
     
-    for filename, data in results['files'].items():
-        year = extract_year_from_filename(filename)
-        
-        yearly_data[year]['file_count'] += 1
-        yearly_data[year]['total_tokens'] += data['total_tokens']
-        yearly_data[year]['found_count'] += data['found_count']
-        yearly_data[year]['not_found_count'] += data['not_found_count']
+    Args:
+        results_json_path: Path to dictionary_check_results.json
         
-        # Track unique unknown words across all files in the year
-        if 'not_found_tokens' in data:
-            yearly_data[year]['unique_not_found'].update([w.lower() for w in data['not_found_tokens']])
+    Returns:
+        Tuple of (yearly_data, monthly_data) dictionaries keyed by year
+        (e.g., '1817') and year-month (e.g., '1817-01'), or 'Unknown'
+    """
+    print(f"Loading results from: {results_json_path}")
+    
+    yearly_data = defaultdict(_new_period_totals)
+    monthly_data = defaultdict(_new_period_totals)
+    
+    print("Processing files...")
     
+    # Stream the per-file entries once and feed both aggregates
+    with open(results_json_path, 'rb') as f:
+        for filename, data in ijson.kvitems(f, 'files'):
+            year, year_month = _periods_from_filename(filename)
+            
+            # Track unique unknown words; interning makes every year and month
+            # set share one string object per word
+            if 'not_found_tokens' in data:
+                unknown_words = [sys.intern(w.lower()) for w in data['not_found_tokens']]
+            else:
+                unknown_words = []
+            
+            for period_data in (yearly_data[year], monthly_data[year_month]):
+                period_data['file_count'] += 1
+                period_data['total_tokens'] += data['total_tokens']
+                period_data['found_count'] += data['found_count']
+                period_data['not_found_count'] += data['not_found_count']
+                period_data['unique_not_found'].update(unknown_words)
+    
+    return yearly_data, monthly_data
+
+
+def generate_yearly_summary(yearly_data, output_csv_path):
+    """Generate a year-based summary report in CSV format.
+    
+    Args:
+        yearly_data: Per-year aggregates from aggregate_results
+        output_csv_path: Path for output CSV file
+    """
     # Write to CSV
     print(f"\nExporting yearly summary to CSV...")
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(output_csv_path, 'wb', buffering=_CSV_BUFFER_SIZE) as csvfile:
         fieldnames = [
             'year',
             'file_count',
@@ -77,29 +126,30 @@ def generate_yearly_summary(results_json_path, output_csv_path):
             'error_rate_per_token'
         ]
         
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        # Every field is a count, a rounded float or a period label, so
+        # lines are formatted directly instead of going through csv
+        csvfile.write(_csv_line(fieldnames).encode('utf-8'))
         
         # Sort by year
-        for year in sorted(yearly_data.keys()):
-            data = yearly_data[year]
-            
+        rows = []
+        for year, data in sorted(yearly_data.items()):
             found_pct = (data['found_count'] / data['total_tokens'] * 100) if data['total_tokens'] > 0 else 0
             avg_tokens = data['total_tokens'] / data['file_count'] if data['file_count'] > 0 else 0
             unique_not_found = len(data['unique_not_found'])
             error_rate = (data['not_found_count'] / data['total_tokens'] * 100) if data['total_tokens'] > 0 else 0
             
-            writer.writerow({
-                'year': year,
-                'file_count': data['file_count'],
-                'total_tokens': data['total_tokens'],
-                'found_count': data['found_count'],
-                'not_found_count': data['not_found_count'],
-                'found_percentage': round(found_pct, 2),
-                'avg_tokens_per_file': round(avg_tokens, 1),
-                'unique_not_found_words': unique_not_found,
-                'error_rate_per_token': round(error_rate, 2)
-            })
+            rows.append((
+                year,
+                data['file_count'],
+                data['total_tokens'],
+                data['found_count'],
+                data['not_found_count'],
+                round(found_pct, 2),
+                round(avg_tokens, 1),
+                unique_not_found,
+                round(error_rate, 2)
+            ))
+        csvfile.write(''.join(map(_csv_line, rows)).encode('utf-8'))
     
     print(f"✓ Yearly summary exported to: {output_csv_path}")
     print(f"  File size: {os.path.getsize(output_csv_path):,} bytes")
@@ -112,61 +162,23 @@ def generate_yearly_summary(results_json_path, output_csv_path):
     print(f"{'Year':<8} {'Files':<8} {'Total Tokens':<15} {'Found %':<10} {'Avg/File':<12}")
     print(f"{'-'*80}")
     
-    for year in sorted(yearly_data.keys()):
-        data = yearly_data[year]
-        found_pct = (data['found_count'] / data['total_tokens'] * 100) if data['total_tokens'] > 0 else 0
-        avg_tokens = data['total_tokens'] / data['file_count'] if data['file_count'] > 0 else 0
-        
-        print(f"{year:<8} {data['file_count']:<8} {data['total_tokens']:<15,} {found_pct:<10.2f} {avg_tokens:<12.1f}")
+    # Reuse the CSV rows rather than walking and recomputing the aggregates
+    for year, file_count, total_tokens, _, _, found_pct, avg_tokens, _, _ in rows:
+        print(f"{year:<8} {file_count:<8} {total_tokens:<15,} {found_pct:<10.2f} {avg_tokens:<12.1f}")
     
     print(f"{'='*80}\n")
 
 
-def generate_monthly_summary(results_json_path, output_csv_path):
+def generate_monthly_summary(monthly_data, output_csv_path):
     """Generate a year-month based summary report in CSV format.
     
     Args:
-        results_json_path: Path to dictionary_check_results.json
+        monthly_data: Per-year-month aggregates from aggregate_results
         output_csv_path: Path for output CSV file
     """
-    print(f"Loading results from: {results_json_path}")
-    with open(results_json_path, 'r', encoding='utf-8') as f:
-        results = json.load(f)
-    
-    # Aggregate data by year-month
-    monthly_data = defaultdict(lambda: {
-        'file_count': 0,
-        'total_tokens': 0,
-        'found_count': 0,
-        'not_found_count': 0,
-        'unique_not_found': set()
-    })
-    
-    print(f"Processing {len(results['files'])} files...")
-    
-    for filename, data in results['files'].items():
-        try:
-            # Expected format: 1817-01_486376978.txt
-            date_part = filename.split('_')[0]  # Get "1817-01"
-            if '-' in date_part:
-                year_month = date_part  # Keep as "1817-01"
-            else:
-                year_month = 'Unknown'
-        except:
-            year_month = 'Unknown'
-        
-        monthly_data[year_month]['file_count'] += 1
-        monthly_data[year_month]['total_tokens'] += data['total_tokens']
-        monthly_data[year_month]['found_count'] += data['found_count']
-        monthly_data[year_month]['not_found_count'] += data['not_found_count']
-        
-        # Track unique unknown words
-        if 'not_found_tokens' in data:
-            monthly_data[year_month]['unique_not_found'].update([w.lower() for w in data['not_found_tokens']])
-    
     # Write to CSV
     print(f"\nExporting monthly summary to CSV...")
-    with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+    with open(output_csv_path, 'wb', buffering=_CSV_BUFFER_SIZE) as csvfile:
         fieldnames = [
             'year_month',
             'year',
@@ -181,13 +193,13 @@ def generate_monthly_summary(results_json_path, output_csv_path):
             'error_rate_per_token'
         ]
         
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        # Every field is a count, a rounded float or a period label, so
+        # lines are formatted directly instead of going through csv
+        csvfile.write(_csv_line(fieldnames).encode('utf-8'))
         
         # Sort by year-month
-        for year_month in sorted(monthly_data.keys()):
-            data = monthly_data[year_month]
-            
+        rows = []
+        for year_month, data in sorted(monthly_data.items()):
             # Split year and month
             if '-' in year_month and year_month != 'Unknown':
                 year, month = year_month.split('-')
@@ -199,19 +211,20 @@ def generate_monthly_summary(results_json_path, output_csv_path):
             unique_not_found = len(data['unique_not_found'])
             error_rate = (data['not_found_count'] / data['total_tokens'] * 100) if data['total_tokens'] > 0 else 0
             
-            writer.writerow({
-                'year_month': year_month,
-                'year': year,
-                'month': month,
-                'file_count': data['file_count'],
-                'total_tokens': data['total_tokens'],
-                'found_count': data['found_count'],
-                'not_found_count': data['not_found_count'],
-                'found_percentage': round(found_pct, 2),
-                'avg_tokens_per_file': round(avg_tokens, 1),
-                'unique_not_found_words': unique_not_found,
-                'error_rate_per_token': round(error_rate, 2)
-            })
+            rows.append((
+                year_month,
+                year,
+                month,
+                data['file_count'],
+                data['total_tokens'],
+                data['found_count'],
+                data['not_found_count'],
+                round(found_pct, 2),
+                round(avg_tokens, 1),
+                unique_not_found,
+                round(error_rate, 2)
+            ))
+        csvfile.write(''.join(map(_csv_line, rows)).encode('utf-8'))
     
     print(f"✓ Monthly summary exported to: {output_csv_path}")
     print(f"  File size: {os.path.getsize(output_csv_path):,} bytes")
@@ -238,13 +251,16 @@ def main():
         print("Run check_dictionary.py first to generate results.")
         return
     
+    # Read the results once for both reports
+    yearly_data, monthly_data = aggregate_results(results_json)
+    
     # Generate yearly summary
-    generate_yearly_summary(results_json, yearly_csv)
+    generate_yearly_summary(yearly_data, yearly_csv)
     
     print()
     
     # Generate monthly summary
-    generate_monthly_summary(results_json, monthly_csv)
+    generate_monthly_summary(monthly_data, monthly_csv)
     
     print(f"\n{'='*80}")
     print("Export Complete!")
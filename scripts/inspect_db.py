@@ -1,13 +1,38 @@
 import sqlite3
 import os
+import pathlib
 
 db_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'dictionary.db')
-conn = sqlite3.connect(db_path)
+# Open read-only so inspecting never modifies the tracked database file
+conn = sqlite3.connect(pathlib.Path(db_path).resolve().as_uri() + '?mode=ro', uri=True)
+# Large page cache, memory-mapped reads and in-memory temp storage for the
+# cold full-table passes below
+conn.executescript("PRAGMA cache_size=-262144; PRAGMA mmap_size=1073741824; PRAGMA temp_store=MEMORY;")
 cursor = conn.cursor()
 
+# Read everything below from one snapshot
+cursor.execute("BEGIN")
+
 # Get all tables
-cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
 tables = cursor.fetchall()
+
+
+def quote_identifier(name):
+    """Quote a table name for use in SQL, doubling any embedded quotes."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+# Exact row counts for every table in a single query; rows are labelled by
+# position so table names never appear as string literals
+row_counts = {}
+if tables:
+    cursor.execute(" UNION ALL ".join(
+        f"SELECT {i}, COUNT(*) FROM {quote_identifier(name)}"
+        for i, (name,) in enumerate(tables)
+    ))
+    row_counts = {tables[i][0]: count for i, count in cursor.fetchall()}
+
 print("Tables in database:")
 for table in tables:
     print(f"  - {table[0]}")
@@ -29,8 +54,8 @@ for table in tables:
         print(f"  {row}")
     
     # Get count
-    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-    count = cursor.fetchone()[0]
+    count = row_counts[table_name]
     print(f"\nTotal rows in '{table_name}': {count:,}")
 
+conn.rollback()
 conn.close()
@@ -1,8 +1,34 @@
-import json
 import os
+import sys
+
+# allow importing from src
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from src.json_io import load_json
+
+
+def count_lines(path):
+    """Count newlines in a file by reading it in 1 MiB binary blocks."""
+    lines = 0
+    with open(path, 'rb') as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            lines += block.count(b'\n')
+    return lines
+
 
 # Verify data integrity
-data_dir = 'c:/Users/Ed/projects/lexical-checker/data'
+data_dir = os.path.join(ROOT, 'data')
+output_dir = os.path.join(ROOT, 'output')
+
+# List the data directory once; existence checks and sizes come from here
+data_entries = {}
+if os.path.isdir(data_dir):
+    with os.scandir(data_dir) as it:
+        data_entries = {entry.name: entry for entry in it}
 
 print("="*60)
 print("SANITY CHECK - Data Integrity")
@@ -10,9 +36,8 @@ print("="*60)
 
 # Check dictionary_check_results.json
 results_file = os.path.join(data_dir, 'dictionary_check_results.json')
-if os.path.exists(results_file):
-    with open(results_file, 'r', encoding='utf-8') as f:
-        results = json.load(f)
+if 'dictionary_check_results.json' in data_entries:
+    results = load_json(results_file)
     print(f"\n✓ dictionary_check_results.json")
     print(f"  Files: {len(results['files'])}")
     print(f"  Summary keys: {list(results['summary'].keys())}")
@@ -24,9 +49,8 @@ else:
 
 # Check tokenized_summary.json
 tokenized_file = os.path.join(data_dir, 'tokenized_summary.json')
-if os.path.exists(tokenized_file):
-    with open(tokenized_file, 'r', encoding='utf-8') as f:
-        tokenized = json.load(f)
+if 'tokenized_summary.json' in data_entries:
+    tokenized = load_json(tokenized_file)
     print(f"\n✓ tokenized_summary.json")
     print(f"  Files: {len(tokenized['files'])}")
     print(f"  Total tokens: {tokenized['total_tokens']:,}")
@@ -49,20 +73,19 @@ print("CSV Files")
 print("="*60)
 
 for csv_file in csv_files:
-    path = os.path.join(data_dir, csv_file)
-    if os.path.exists(path):
-        size = os.path.getsize(path)
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = sum(1 for _ in f)
+    if csv_file in data_entries:
+        entry = data_entries[csv_file]
+        size = entry.stat().st_size
+        lines = count_lines(entry.path)
         print(f"✓ {csv_file}: {size:,} bytes, {lines:,} lines")
     else:
         print(f"✗ {csv_file}: NOT FOUND")
 
 # Check output directory
-output_dir = 'c:/Users/Ed/projects/lexical-checker/output'
-if os.path.exists(output_dir):
-    txt_files = [f for f in os.listdir(output_dir) if f.endswith('.txt')]
-    total_size = sum(os.path.getsize(os.path.join(output_dir, f)) for f in txt_files)
+if os.path.isdir(output_dir):
+    with os.scandir(output_dir) as it:
+        txt_files = [entry for entry in it if entry.name.endswith('.txt')]
+    total_size = sum(entry.stat().st_size for entry in txt_files)
     print(f"\n{'='*60}")
     print("Output Directory")
     print("="*60)
@@ -75,13 +98,8 @@ print(f"\n{'='*60}")
 print("Data Consistency Check")
 print("="*60)
 
-# Verify counts match
-if os.path.exists(results_file) and os.path.exists(tokenized_file):
-    with open(results_file, 'r', encoding='utf-8') as f:
-        results = json.load(f)
-    with open(tokenized_file, 'r', encoding='utf-8') as f:
-        tokenized = json.load(f)
-    
+# Verify counts match (both files were loaded above)
+if 'dictionary_check_results.json' in data_entries and 'tokenized_summary.json' in data_entries:
     if len(results['files']) == len(tokenized['files']):
         print(f"✓ File counts match: {len(results['files'])}")
     else:
@@ -0,0 +1,41 @@
+"""
+Test script to verify text extraction around comments and processing instructions.
+"""
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+
+from lxml import etree
+
+from src.xml_parser import extract_text_from_element
+
+
+SAMPLE = (
+    '<sec>Before <!-- note -->after comment '
+    '<p>Inside <?render page?>after pi</p> '
+    '<sec-meta>Hidden <!-- hidden -->hidden tail</sec-meta>'
+    ' end</sec>'
+)
+EXPECTED = 'Before after comment Inside after pi  end'
+
+
+def test_extract_text():
+    print("="*60)
+    print("Testing Text Extraction")
+    print("="*60)
+
+    text = extract_text_from_element(etree.fromstring(SAMPLE))
+    print(f"\n   Sample:   {SAMPLE}")
+    print(f"   Expected: {EXPECTED!r}")
+    print(f"   Got:      {text!r}")
+    assert text == EXPECTED, "comment or processing instruction tail lost"
+
+    print("\n" + "="*60)
+    print("✓ Comment and processing instruction tails kept")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    test_extract_text()
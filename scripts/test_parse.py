@@ -1,11 +1,12 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
-from src.xml_parser import process_xml_to_output
+from src.xml_parser import parse_xml_to_articles, save_articles_to_files
 
 
 def main():
@@ -17,25 +18,29 @@ def main():
         print(f'Docs directory not found: {docs}')
         return
     
-    # Process all XML files recursively
-    total_files = 0
-    xml_count = 0
+    # Collect all XML files recursively
+    xml_paths = [
+        os.path.join(root, name)
+        for root, dirs, files in os.walk(docs)
+        for name in files
+        if name.lower().endswith('.xml')
+    ]
     
-    for root, dirs, files in os.walk(docs):
-        for name in files:
-            if not name.lower().endswith('.xml'):
-                continue
-            xml_path = os.path.join(root, name)
-            xml_count += 1
-            
+    # Parse the XML files in parallel; each one is independent. Articles are
+    # written here in walk order, so a name produced by several files always
+    # ends up with the same (last) file's text
+    total_files = 0
+    with ProcessPoolExecutor() as executor:
+        article_lists = executor.map(parse_xml_to_articles, xml_paths, chunksize=4)
+        for xml_path, articles in zip(xml_paths, article_lists):
+            count = save_articles_to_files(articles, output)
             # Show relative path for better context
             rel_path = os.path.relpath(xml_path, docs)
-            print(f"Processing {rel_path}...")
-            count = process_xml_to_output(xml_path, output)
+            print(f"Processed {rel_path}")
             total_files += count
             print(f"  -> Created {count} text files")
     
-    print(f"\nProcessed {xml_count} XML file(s)")
+    print(f"\nProcessed {len(xml_paths)} XML file(s)")
     print(f"Total: {total_files} article files written to '{output}'")
     
     # Show a sample of what was created
@@ -1,12 +1,12 @@
 import os
 import sys
-import json
 
 # allow importing from src
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.insert(0, ROOT)
 
 from src.tokenizer import ensure_nltk_data, tokenize_directory, get_token_statistics
+from src.json_io import dump_json
 
 
 def main():
@@ -23,8 +23,8 @@ def main():
     
     print(f"Tokenizing all text files in: {output_dir}\n")
     
-    # Tokenize all files
-    results = tokenize_directory(output_dir)
+    # Tokenize all files, one worker process per CPU
+    results = tokenize_directory(output_dir, max_workers=os.cpu_count() or 1)
     
     if not results:
         print("No files to tokenize.")
@@ -35,11 +35,20 @@ def main():
     print(f"{'='*60}")
     print(f"Total files processed: {len(results)}")
     
-    # Calculate overall statistics
-    total_tokens = sum(len(tokens) for tokens in results.values())
+    # Calculate overall statistics and the per-file summary in one pass,
+    # building each file's token set only once
+    total_tokens = 0
     all_unique_tokens = set()
-    for tokens in results.values():
-        all_unique_tokens.update(tokens)
+    file_summaries = {}
+    for filename, tokens in results.items():
+        file_unique = set(tokens)
+        file_summaries[filename] = {
+            'token_count': len(tokens),
+            'unique_count': len(file_unique),
+            'tokens': tokens  # Include full token list
+        }
+        total_tokens += len(tokens)
+        all_unique_tokens |= file_unique
     
     print(f"Total tokens across all files: {total_tokens:,}")
     print(f"Unique tokens across all files: {len(all_unique_tokens):,}")
@@ -68,19 +77,12 @@ def main():
         'total_files': len(results),
         'total_tokens': total_tokens,
         'unique_tokens': len(all_unique_tokens),
-        'files': {}
+        'files': file_summaries
     }
     
-    for filename, tokens in results.items():
-        summary['files'][filename] = {
-            'token_count': len(tokens),
-            'unique_count': len(set(tokens)),
-            'tokens': tokens  # Include full token list
-        }
-    
     os.makedirs(os.path.dirname(save_path), exist_ok=True)
-    with open(save_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2)
+    # Written unindented: one token per line would multiply the file size
+    dump_json(summary, save_path, indent=False)
     
     print(f"Tokenized data saved to: {save_path}")
     print(f"File size: {os.path.getsize(save_path):,} bytes")
@@ -1,7 +1,36 @@
 import os
+import contextlib
+import marshal
+import pathlib
 import sqlite3
-from typing import List, Dict, Set, Optional, Tuple
-import json
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple
+
+import ijson
+
+# Sibling modules are imported relative to the src package; the plain
+# imports are only for running this file directly as a script
+try:
+    from .hyphenated_handler import HyphenatedWordHandler
+    from .json_io import dump_json
+except ImportError:
+    from hyphenated_handler import HyphenatedWordHandler
+    from json_io import dump_json
+
+try:
+    if __package__:
+        from .stemmer import TokenStemmer
+    else:
+        from stemmer import TokenStemmer
+except ImportError:
+    # Stemming needs nltk; it is only required when use_stemming=True
+    TokenStemmer = None
+
+# Bump when the layout of the word cache sidecar changes
+_WORD_CACHE_VERSION = 1
+
+# Distinct misses remembered by analyze_tokens' stemming/hyphenation path
+_MISS_CACHE_SIZE = 131072
 
 
 class DictionaryChecker:
@@ -17,14 +46,22 @@ class DictionaryChecker:
             handle_hyphenated: Whether to use special handling for hyphenated words
         """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # The dictionary is only ever read; opening it read-only also stops
+        # sqlite3 from silently creating an empty database at a wrong path
+        self.conn = sqlite3.connect(pathlib.Path(db_path).resolve().as_uri() + '?mode=ro', uri=True)
+        # Keep the b-tree resident during the one full scan of the entries table
+        self.conn.executescript(
+            "PRAGMA query_only=1; PRAGMA cache_size=-262144; "
+            "PRAGMA mmap_size=1073741824; PRAGMA temp_store=MEMORY;"
+        )
         self.cursor = self.conn.cursor()
         self.use_stemming = use_stemming
         self.stemmer = stemmer
         self.handle_hyphenated = handle_hyphenated
         
-        # Cache for performance
-        self._word_cache: Set[str] = set()
+        # Cache for performance, persisted next to the database
+        self._word_cache: FrozenSet[str] = frozenset()
+        self._word_cache_path = db_path + '.words.marshal'
         self._cache_initialized = False
         
         # Statistics for stem-based matches
@@ -35,8 +72,11 @@ class DictionaryChecker:
             'no_matches': 0
         }
         
-        # Hyphenated word handler (lazy initialization)
-        self._hyphenated_handler = None
+        # Hyphenated word handler
+        self._hyphenated_handler = HyphenatedWordHandler(self, stemmer)
+        
+        # Per-instance cache of the hyphenation/stemming result for a miss
+        self._miss_results: Dict[str, Tuple] = {}
     
     def _initialize_cache(self):
         """Load all dictionary words into memory for faster lookups."""
@@ -44,11 +84,49 @@ class DictionaryChecker:
             return
         
         print("Loading dictionary into memory...")
-        self.cursor.execute("SELECT DISTINCT LOWER(word) FROM entries")
-        self._word_cache = {row[0] for row in self.cursor.fetchall()}
+        if not self._load_word_cache_file():
+            # Stream the raw words and let the set deduplicate, rather than asking
+            # SQLite to lower and sort them for DISTINCT
+            self.cursor.execute("SELECT word FROM entries WHERE word IS NOT NULL")
+            self._word_cache = frozenset(word.lower() for (word,) in self.cursor)
+            self._save_word_cache_file()
         self._cache_initialized = True
         print(f"Loaded {len(self._word_cache):,} unique words")
     
+    def _database_signature(self) -> Tuple[int, int, int]:
+        """Identify the current database file by cache version, mtime and size."""
+        st = os.stat(self.db_path)
+        return (_WORD_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    
+    def _load_word_cache_file(self) -> bool:
+        """Load the word set from the marshal sidecar written by a previous run.
+        
+        Returns:
+            True if the sidecar exists and matches the current database
+        """
+        try:
+            with open(self._word_cache_path, 'rb') as f:
+                signature, words = marshal.load(f)
+            if signature != self._database_signature():
+                return False
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        
+        self._word_cache = words
+        return True
+    
+    def _save_word_cache_file(self):
+        """Write the word set to the marshal sidecar for faster later startups."""
+        # Write under a per-process name so concurrent checkers don't collide
+        tmp_path = f"{self._word_cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                marshal.dump((self._database_signature(), self._word_cache), f)
+            os.replace(tmp_path, self._word_cache_path)
+        except OSError:
+            # Read-only data directory: the cache is simply rebuilt next time
+            pass
+    
     def get_dictionary_size(self) -> int:
         """Get the number of unique words in the dictionary."""
         self._initialize_cache()
@@ -70,40 +148,92 @@ class DictionaryChecker:
         """
         self._initialize_cache()
         
+        found, match_type, stats_keys = self.match_word(word, case_sensitive, allow_hyphenated)
+        self._count_matches(stats_keys)
+        return (found, match_type)
+    
+    def match_word(self, word: str, case_sensitive: bool = False,
+                   allow_hyphenated: bool = True) -> Tuple[bool, str, Tuple[str, ...]]:
+        """Check a word like is_in_dictionary, without touching stem_match_stats.
+        
+        Returns:
+            Tuple of (bool, match_type, stats_keys), where stats_keys holds the
+            stem_match_stats entry of every dictionary lookup made, ending with
+            the one for this word; callers count them with _count_matches
+        """
+        stats_keys = ()
+        
         # Check hyphenated words if enabled (guard against recursion)
         if allow_hyphenated and self.handle_hyphenated and '-' in word:
-            if self._hyphenated_handler is None:
-                # Lazy initialization
-                import sys
-                import os
-                here = os.path.dirname(os.path.abspath(__file__))
-                if here not in sys.path:
-                    sys.path.insert(0, here)
-                from hyphenated_handler import HyphenatedWordHandler
-                self._hyphenated_handler = HyphenatedWordHandler(self, self.stemmer)
-            
-            is_valid, match_type, details = self._hyphenated_handler.is_valid_hyphenated_word(word)
+            (is_valid, match_type, details), stats_keys = self._hyphenated_handler.match_hyphenated_word(word)
             if is_valid:
-                self.stem_match_stats['hyphenated_matches'] += 1
-                return (True, f'hyphenated_{match_type}')
+                return (True, f'hyphenated_{match_type}', stats_keys + ('hyphenated_matches',))
         
         check_word = word if case_sensitive else word.lower()
         
         # Check original form first
         if check_word in self._word_cache:
-            self.stem_match_stats['original_matches'] += 1
-            return (True, 'original')
+            return (True, 'original', stats_keys + ('original_matches',))
         
         # Check stem form if enabled
         if self.use_stemming and self.stemmer:
             stem_form = self.stemmer.stem_token(word)
             stem_check = stem_form if case_sensitive else stem_form.lower()
             if stem_check != check_word and stem_check in self._word_cache:
-                self.stem_match_stats['stem_matches'] += 1
-                return (True, 'stem')
+                return (True, 'stem', stats_keys + ('stem_matches',))
+        
+        return (False, 'none', stats_keys + ('no_matches',))
+    
+    def _count_matches(self, stats_keys: Iterable[str]):
+        """Add one to the stem_match_stats entry of each lookup in stats_keys."""
+        stats = self.stem_match_stats
+        for key in stats_keys:
+            stats[key] += 1
+    
+    def _resolve_miss(self, token: str) -> Tuple:
+        """Resolve a token that is not a plain dictionary word, with caching.
         
-        self.stem_match_stats['no_matches'] += 1
-        return (False, 'none')
+        The lookups behind a cached resolution are counted on every call, so
+        stem_match_stats matches an uncached run.
+        
+        Returns:
+            ('hyphenated', match_type, details), ('stem', stem_form) or ('none',)
+        """
+        results = self._miss_results
+        cached = results.get(token)
+        if cached is None:
+            if len(results) >= _MISS_CACHE_SIZE:
+                # Starting over is cheaper than tracking recency, and the
+                # common misses are cached again right away
+                results.clear()
+            cached = results[token] = self._resolve_miss_uncached(token)
+        resolution, stats_keys = cached
+        self._count_matches(stats_keys)
+        return resolution
+    
+    def _resolve_miss_uncached(self, token: str) -> Tuple[Tuple, Tuple[str, ...]]:
+        """Try hyphenated handling, then stemming, for a token missing from the dictionary.
+        
+        Returns:
+            Tuple of (resolution, stats_keys), where stats_keys are the
+            stem_match_stats entries of the dictionary lookups made
+        """
+        resolution = ('none',)
+        stats_keys = ()
+        
+        # Check hyphenated word handling
+        if self.handle_hyphenated and '-' in token:
+            (is_valid, match_type, details), stats_keys = self._hyphenated_handler.match_hyphenated_word(token)
+            if is_valid:
+                resolution = ('hyphenated', match_type, details)
+        
+        # Check stem form if not found via hyphenation
+        if resolution[0] == 'none' and self.use_stemming and self.stemmer:
+            stem_form = self.stemmer.stem_token(token)
+            if stem_form != token.lower() and stem_form in self._word_cache:
+                resolution = ('stem', stem_form)
+        
+        return resolution, stats_keys
     
     def check_tokens(self, tokens: List[str]) -> Dict[str, bool]:
         """Check a list of tokens against the dictionary.
@@ -116,21 +246,40 @@ class DictionaryChecker:
         """
         self._initialize_cache()
         
-        results = {}
-        for token in tokens:
-            # Check lowercase version
-            token_lower = token.lower()
-            if token_lower not in results:
-                found, _ = self.is_in_dictionary(token_lower)
+        cache = self._word_cache
+        check_hyphenated = self.handle_hyphenated
+        match_word = self.match_word
+        # Match counts are tallied locally and added to stem_match_stats once
+        counts = dict.fromkeys(self.stem_match_stats, 0)
+        
+        # Deduplicate in C first so each distinct lowercase token is checked once
+        results = dict.fromkeys(map(str.lower, tokens))
+        for token_lower in results:
+            if token_lower in cache and not (check_hyphenated and '-' in token_lower):
+                # Plain hit: is_in_dictionary would return (True, 'original')
+                results[token_lower] = True
+                counts['original_matches'] += 1
+            else:
+                found, _, stats_keys = match_word(token_lower, False, True)
                 results[token_lower] = found
+                for key in stats_keys:
+                    counts[key] += 1
         
+        for key, count in counts.items():
+            self.stem_match_stats[key] += count
         return results
     
-    def analyze_tokens(self, tokens: List[str]) -> Dict:
+    def analyze_tokens(self, tokens: List[str], include_lists: bool = True,
+                       collect_match_details: bool = False) -> Dict:
         """Analyze tokens and categorize them by dictionary status.
         
         Args:
             tokens: List of tokens to analyze
+            include_lists: Whether to include the per-token found/not-found lists
+                and the sorted unique_found_list; the sorted unique not-found,
+                stem and hyphenated lists are always included
+            collect_match_details: Whether to include match_details, one dict
+                per token describing how it matched
             
         Returns:
             Dictionary with counts and lists of found/not-found tokens
@@ -145,53 +294,52 @@ class DictionaryChecker:
         # Track match types
         match_details = []
         
-        for token in tokens:
-            token_lower = token.lower()
-            
+        # Test each distinct token against the dictionary once with set
+        # algebra; the loop below only probes the much smaller set of misses
+        lowers = list(map(str.lower, tokens))
+        unique_tokens = set(lowers)
+        misses = unique_tokens - self._word_cache
+        check_hyphenated = self.handle_hyphenated
+        check_stems = bool(self.use_stemming and self.stemmer)
+        # Bound once for the per-token loop
+        resolve_miss = self._resolve_miss
+        append_not_found = not_found_tokens.append
+        
+        pairs = zip(tokens, lowers)
+        if not collect_match_details:
+            # Without per-token details the plain hits need no loop, and the
+            # loop below only sees the misses
+            found_tokens = [token for token, token_lower in zip(tokens, lowers) if token_lower not in misses]
+            if misses:
+                pairs = ((token, token_lower) for token, token_lower in zip(tokens, lowers) if token_lower in misses)
+            else:
+                pairs = ()
+        
+        for token, token_lower in pairs:
             # Check original form first
-            if token_lower in self._word_cache:
+            if token_lower not in misses:
                 found_tokens.append(token)
                 match_details.append({'token': token, 'match_type': 'original', 'stem': None})
+            elif (check_hyphenated and '-' in token) or check_stems:
+                resolution = resolve_miss(token)
+                if resolution[0] == 'hyphenated':
+                    hyphenated_found_tokens.append(token)
+                    if collect_match_details:
+                        match_details.append({'token': token, 'match_type': f'hyphenated_{resolution[1]}', 'details': resolution[2]})
+                elif resolution[0] == 'stem':
+                    stem_found_tokens.append(token)
+                    if collect_match_details:
+                        match_details.append({'token': token, 'match_type': 'stem', 'stem': resolution[1]})
+                else:
+                    append_not_found(token)
             else:
-                # Check hyphenated word handling
-                hyphenated_matched = False
-                if self.handle_hyphenated and '-' in token:
-                    if self._hyphenated_handler is None:
-                        # Lazy initialization
-                        import sys
-                        import os
-                        here = os.path.dirname(os.path.abspath(__file__))
-                        if here not in sys.path:
-                            sys.path.insert(0, here)
-                        from hyphenated_handler import HyphenatedWordHandler
-                        self._hyphenated_handler = HyphenatedWordHandler(self, self.stemmer)
-                    
-                    is_valid, match_type, details = self._hyphenated_handler.is_valid_hyphenated_word(token)
-                    if is_valid:
-                        hyphenated_found_tokens.append(token)
-                        match_details.append({'token': token, 'match_type': f'hyphenated_{match_type}', 'details': details})
-                        hyphenated_matched = True
-                
-                # Check stem form if not found via hyphenation
-                if not hyphenated_matched:
-                    stem_matched = False
-                    stem_form = None
-                    
-                    if self.use_stemming and self.stemmer:
-                        stem_form = self.stemmer.stem_token(token)
-                        if stem_form != token_lower and stem_form in self._word_cache:
-                            stem_found_tokens.append(token)
-                            match_details.append({'token': token, 'match_type': 'stem', 'stem': stem_form})
-                            stem_matched = True
-                    
-                    if not stem_matched:
-                        not_found_tokens.append(token)
+                append_not_found(token)
         
         # Calculate unique sets (case-insensitive)
-        unique_found = set(t.lower() for t in found_tokens)
-        unique_stem_found = set(t.lower() for t in stem_found_tokens)
-        unique_hyphenated_found = set(t.lower() for t in hyphenated_found_tokens)
-        unique_not_found = set(t.lower() for t in not_found_tokens)
+        unique_found = unique_tokens - misses
+        unique_stem_found = set(map(str.lower, stem_found_tokens))
+        unique_hyphenated_found = set(map(str.lower, hyphenated_found_tokens))
+        unique_not_found = set(map(str.lower, not_found_tokens))
         
         # Combined found (original + stem + hyphenated)
         all_found = found_tokens + stem_found_tokens + hyphenated_found_tokens
@@ -212,17 +360,20 @@ class DictionaryChecker:
             'found_percentage': (len(found_tokens) / len(tokens) * 100) if tokens else 0,
             'combined_found_percentage': (len(all_found) / len(tokens) * 100) if tokens else 0,
             'stem_contribution': (len(stem_found_tokens) / len(tokens) * 100) if tokens else 0,
-            'hyphenated_contribution': (len(hyphenated_found_tokens) / len(tokens) * 100) if tokens else 0,
-            'found_tokens': found_tokens,
-            'stem_found_tokens': stem_found_tokens,
-            'hyphenated_found_tokens': hyphenated_found_tokens,
-            'not_found_tokens': not_found_tokens,
-            'unique_found_list': sorted(unique_found),
-            'unique_stem_found_list': sorted(unique_stem_found),
-            'unique_hyphenated_found_list': sorted(unique_hyphenated_found),
-            'unique_not_found_list': sorted(unique_not_found),
-            'match_details': match_details
+            'hyphenated_contribution': (len(hyphenated_found_tokens) / len(tokens) * 100) if tokens else 0
         }
+        if include_lists:
+            result['found_tokens'] = found_tokens
+            result['stem_found_tokens'] = stem_found_tokens
+            result['hyphenated_found_tokens'] = hyphenated_found_tokens
+            result['not_found_tokens'] = not_found_tokens
+            # Usually the largest list, and not needed for per-file results
+            result['unique_found_list'] = sorted(unique_found)
+        result['unique_stem_found_list'] = sorted(unique_stem_found)
+        result['unique_hyphenated_found_list'] = sorted(unique_hyphenated_found)
+        result['unique_not_found_list'] = sorted(unique_not_found)
+        if collect_match_details:
+            result['match_details'] = match_details
         
         # Add stemming stats if enabled
         if self.use_stemming or self.handle_hyphenated:
@@ -232,6 +383,7 @@ class DictionaryChecker:
     
     def close(self):
         """Close the database connection."""
+        self._miss_results.clear()
         if self.conn:
             self.conn.close()
     
@@ -242,8 +394,93 @@ class DictionaryChecker:
         self.close()
 
 
+def _check_file_tokens(checker: DictionaryChecker, tokens: List[str]) -> Dict:
+    """Analyze one file's tokens and build its entry for the results JSON."""
+    analysis = checker.analyze_tokens(tokens, include_lists=False)
+    
+    # Store file results
+    file_results = {
+        'total_tokens': analysis['total_tokens'],
+        'found_count': analysis['found_count'],
+        'not_found_count': analysis['not_found_count'],
+        'found_percentage': analysis['found_percentage'],
+        'unique_not_found': analysis['unique_not_found'],
+        'not_found_tokens': analysis['unique_not_found_list']
+    }
+    
+    # Add stemming-specific results if enabled
+    if checker.use_stemming or checker.handle_hyphenated:
+        if 'stem_found_count' in analysis:
+            file_results['stem_found_count'] = analysis['stem_found_count']
+        if 'hyphenated_found_count' in analysis:
+            file_results['hyphenated_found_count'] = analysis['hyphenated_found_count']
+        if 'combined_found_count' in analysis:
+            file_results['combined_found_count'] = analysis['combined_found_count']
+            file_results['combined_found_percentage'] = analysis['combined_found_percentage']
+        if 'stem_contribution' in analysis:
+            file_results['stem_contribution'] = analysis['stem_contribution']
+        if 'hyphenated_contribution' in analysis:
+            file_results['hyphenated_contribution'] = analysis['hyphenated_contribution']
+        if 'unique_stem_found' in analysis:
+            file_results['unique_stem_found'] = analysis['unique_stem_found']
+            file_results['stem_found_tokens'] = analysis['unique_stem_found_list']
+        if 'unique_hyphenated_found' in analysis:
+            file_results['unique_hyphenated_found'] = analysis['unique_hyphenated_found']
+            file_results['hyphenated_found_tokens'] = analysis['unique_hyphenated_found_list']
+    
+    return file_results
+
+
+# Per-process checker for parallel runs of check_tokenized_files
+_worker_checker: Optional[DictionaryChecker] = None
+
+
+def _init_check_worker(db_path: str, use_stemming: bool, stem_method: str, words: FrozenSet[str]):
+    """Set up the checker of a worker process, reusing the parent's word set."""
+    global _worker_checker
+    stemmer = TokenStemmer(method=stem_method) if use_stemming else None
+    _worker_checker = DictionaryChecker(db_path, use_stemming=use_stemming, stemmer=stemmer, handle_hyphenated=True)
+    _worker_checker._word_cache = words
+    _worker_checker._cache_initialized = True
+
+
+def _check_file_tokens_in_worker(item: Tuple[str, List[str]]) -> Tuple[str, Dict, Dict[str, int]]:
+    """Run _check_file_tokens in a worker and hand its stem_match_stats to the parent."""
+    filepath, tokens = item
+    file_results = _check_file_tokens(_worker_checker, tokens)
+    # Start each file from zero, so the parent can add up the counts
+    stats = _worker_checker.stem_match_stats
+    counts = stats.copy()
+    stats.update(dict.fromkeys(stats, 0))
+    return filepath, file_results, counts
+
+
+def _read_corpus_counts(tokenized_json_path: str) -> Tuple[int, int]:
+    """Read total_files and total_tokens from a tokenized summary JSON file.
+    
+    Both counts are written before the files object, so the parse stops
+    within the first block read instead of going through the token lists.
+    """
+    counts = {}
+    with open(tokenized_json_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix in ('total_files', 'total_tokens'):
+                counts[prefix] = value
+                if len(counts) == 2:
+                    break
+    return counts['total_files'], counts['total_tokens']
+
+
+def _iter_file_tokens(tokenized_json_path: str) -> Iterator[Tuple[str, List[str]]]:
+    """Stream (filepath, tokens) pairs from a tokenized summary JSON file."""
+    with open(tokenized_json_path, 'rb') as f:
+        for filepath, file_data in ijson.kvitems(f, 'files'):
+            yield filepath, file_data['tokens']
+
+
 def check_tokenized_files(tokenized_json_path: str, db_path: str, output_path: Optional[str] = None, 
-                         use_stemming: bool = False, stem_method: str = 'snowball') -> Dict:
+                         use_stemming: bool = False, stem_method: str = 'snowball',
+                         max_workers: int = 1) -> Dict:
     """Check all tokenized files against the dictionary.
     
     Args:
@@ -252,24 +489,21 @@ def check_tokenized_files(tokenized_json_path: str, db_path: str, output_path: O
         output_path: Optional path to save results JSON
         use_stemming: Whether to use stemming for dictionary lookups (default: False)
         stem_method: Stemming method - 'snowball' (default), 'porter', or 'lemmatize'
+        max_workers: Number of processes analyzing files (default: 1, which
+            analyzes every file in this process)
         
     Returns:
         Dictionary containing results for all files and summary statistics
     """
-    # Load tokenized data
+    # Read only the corpus counts up front; the token lists are streamed below
     print(f"Loading tokenized data from {tokenized_json_path}...")
-    with open(tokenized_json_path, 'r', encoding='utf-8') as f:
-        tokenized_data = json.load(f)
+    total_files, total_tokens = _read_corpus_counts(tokenized_json_path)
     
     # Initialize stemmer if requested
     stemmer = None
     if use_stemming:
-        import sys
-        import os
-        here = os.path.dirname(os.path.abspath(__file__))
-        if here not in sys.path:
-            sys.path.insert(0, here)
-        from stemmer import TokenStemmer
+        if TokenStemmer is None:
+            raise ImportError("Stemming requires nltk; install it with: pip install nltk")
         stemmer = TokenStemmer(method=stem_method)
         print(f"Using {stem_method} stemming method")
     
@@ -277,67 +511,63 @@ def check_tokenized_files(tokenized_json_path: str, db_path: str, output_path: O
     checker = DictionaryChecker(db_path, use_stemming=use_stemming, stemmer=stemmer, handle_hyphenated=True)
     dict_size = checker.get_dictionary_size()
     
-    print(f"\nProcessing {len(tokenized_data['files']):,} files...")
+    print(f"\nProcessing {total_files:,} files...")
     
     results = {
         'files': {},
         'summary': {
-            'total_files': len(tokenized_data['files']),
-            'total_tokens': tokenized_data['total_tokens'],
+            'total_files': total_files,
+            'total_tokens': total_tokens,
             'dictionary_words': dict_size,
             'stemming_enabled': use_stemming,
             'stem_method': stem_method if use_stemming else None
         }
     }
     
-    # Process each file
+    # Process each file, aggregating the summary in the same pass
     total_found = 0
     total_not_found = 0
+    total_stem_found = 0
+    total_hyphenated_found = 0
+    total_combined_found = 0
     all_not_found_words = set()
+    all_stem_found = set()
+    all_hyphenated_found = set()
     
-    for i, (filepath, file_data) in enumerate(tokenized_data['files'].items(), 1):
-        if i % 100 == 0:
-            print(f"  Processed {i}/{len(tokenized_data['files'])} files...")
-        
-        tokens = file_data['tokens']
-        analysis = checker.analyze_tokens(tokens)
-        
-        # Store file results
-        file_results = {
-            'total_tokens': analysis['total_tokens'],
-            'found_count': analysis['found_count'],
-            'not_found_count': analysis['not_found_count'],
-            'found_percentage': analysis['found_percentage'],
-            'unique_not_found': analysis['unique_not_found'],
-            'not_found_tokens': analysis['unique_not_found_list']
-        }
-        
-        # Add stemming-specific results if enabled
-        if use_stemming or checker.handle_hyphenated:
-            if 'stem_found_count' in analysis:
-                file_results['stem_found_count'] = analysis['stem_found_count']
-            if 'hyphenated_found_count' in analysis:
-                file_results['hyphenated_found_count'] = analysis['hyphenated_found_count']
-            if 'combined_found_count' in analysis:
-                file_results['combined_found_count'] = analysis['combined_found_count']
-                file_results['combined_found_percentage'] = analysis['combined_found_percentage']
-            if 'stem_contribution' in analysis:
-                file_results['stem_contribution'] = analysis['stem_contribution']
-            if 'hyphenated_contribution' in analysis:
-                file_results['hyphenated_contribution'] = analysis['hyphenated_contribution']
-            if 'unique_stem_found' in analysis:
-                file_results['unique_stem_found'] = analysis['unique_stem_found']
-                file_results['stem_found_tokens'] = analysis['unique_stem_found_list']
-            if 'unique_hyphenated_found' in analysis:
-                file_results['unique_hyphenated_found'] = analysis['unique_hyphenated_found']
-                file_results['hyphenated_found_tokens'] = analysis['unique_hyphenated_found_list']
-        
-        results['files'][filepath] = file_results
-        
-        # Aggregate counts
-        total_found += analysis['found_count']
-        total_not_found += analysis['not_found_count']
-        all_not_found_words.update(analysis['unique_not_found_list'])
+    # Files are independent, so with max_workers > 1 they are spread over
+    # worker processes that each get a copy of the word set instead of
+    # reloading the dictionary
+    file_tokens = _iter_file_tokens(tokenized_json_path)
+    with contextlib.ExitStack() as stack:
+        if max_workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_check_worker,
+                initargs=(db_path, use_stemming, stem_method, checker._word_cache)
+            ))
+            file_outputs = executor.map(_check_file_tokens_in_worker, file_tokens, chunksize=16)
+        else:
+            file_outputs = ((filepath, _check_file_tokens(checker, tokens), None) for filepath, tokens in file_tokens)
+        
+        for i, (filepath, file_results, worker_stats) in enumerate(file_outputs, 1):
+            if i % 100 == 0:
+                print(f"  Processed {i}/{total_files} files...")
+            
+            if worker_stats:
+                for key, count in worker_stats.items():
+                    checker.stem_match_stats[key] += count
+            
+            results['files'][filepath] = file_results
+            
+            # Aggregate counts
+            total_found += file_results['found_count']
+            total_not_found += file_results['not_found_count']
+            all_not_found_words.update(file_results['not_found_tokens'])
+            total_stem_found += file_results.get('stem_found_count', 0)
+            total_hyphenated_found += file_results.get('hyphenated_found_count', 0)
+            total_combined_found += file_results.get('combined_found_count', 0)
+            all_stem_found.update(file_results.get('stem_found_tokens', ()))
+            all_hyphenated_found.update(file_results.get('hyphenated_found_tokens', ()))
     
     # Calculate summary statistics
     results['summary']['total_found'] = total_found
@@ -348,26 +578,14 @@ def check_tokenized_files(tokenized_json_path: str, db_path: str, output_path: O
     
     # Add stemming and hyphenated summary stats
     if use_stemming or checker.handle_hyphenated:
-        total_stem_found = sum(f.get('stem_found_count', 0) for f in results['files'].values())
-        total_hyphenated_found = sum(f.get('hyphenated_found_count', 0) for f in results['files'].values())
-        total_combined_found = sum(f.get('combined_found_count', 0) for f in results['files'].values())
-        
-        all_stem_found = set()
-        all_hyphenated_found = set()
-        for file_data in results['files'].values():
-            if 'stem_found_tokens' in file_data:
-                all_stem_found.update(file_data['stem_found_tokens'])
-            if 'hyphenated_found_tokens' in file_data:
-                all_hyphenated_found.update(file_data['hyphenated_found_tokens'])
-        
         if total_stem_found > 0:
             results['summary']['total_stem_found'] = total_stem_found
-            results['summary']['stem_contribution'] = (total_stem_found / tokenized_data['total_tokens'] * 100)
+            results['summary']['stem_contribution'] = (total_stem_found / total_tokens * 100)
             results['summary']['unique_stem_found_words'] = len(all_stem_found)
         
         if total_hyphenated_found > 0:
             results['summary']['total_hyphenated_found'] = total_hyphenated_found
-            results['summary']['hyphenated_contribution'] = (total_hyphenated_found / tokenized_data['total_tokens'] * 100)
+            results['summary']['hyphenated_contribution'] = (total_hyphenated_found / total_tokens * 100)
             results['summary']['unique_hyphenated_found_words'] = len(all_hyphenated_found)
         
         if total_combined_found > 0:
@@ -376,11 +594,14 @@ def check_tokenized_files(tokenized_json_path: str, db_path: str, output_path: O
         
         results['summary']['stemming_stats'] = checker.stem_match_stats.copy()
     
+    # Only the counts and the sorted list are kept; free the word sets before
+    # the results are serialized
+    del all_not_found_words, all_stem_found, all_hyphenated_found
+    
     # Save results if output path specified
     if output_path:
         print(f"\nSaving results to {output_path}...")
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2)
+        dump_json(results, output_path)
         print("Results saved successfully!")
     
     # Close database connection
@@ -1,9 +1,24 @@
 """Handle hyphenated words for dictionary validation."""
 
-import re
+import string
 from typing import Tuple, List, Dict, Optional
 
 
+# Distinct words whose validation result each handler remembers
+_RESULT_CACHE_SIZE = 100000
+
+# Letters that can be tested for with one set operation on ASCII tokens
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+
+def _has_letter(token: str) -> bool:
+    """Return True if the token contains any alphabetic character."""
+    if token.isascii():
+        # Set intersection runs in C; no generator frame per token
+        return not _ASCII_LETTERS.isdisjoint(token)
+    return any(c.isalpha() for c in token)
+
+
 class HyphenatedWordHandler:
     """Handle validation of hyphenated compound words."""
     
@@ -16,10 +31,20 @@ class HyphenatedWordHandler:
         """
         self.checker = dictionary_checker
         self.stemmer = stemmer
+        
+        # Hyphenated words repeat heavily, so results are memoized per word.
+        # A plain dict of results, rather than an lru_cache around the bound
+        # method, so the cache holds no reference back to this handler
+        self._results: Dict[str, Tuple] = {}
     
     def is_valid_hyphenated_word(self, word: str) -> Tuple[bool, str, Dict]:
         """Check if a hyphenated word is valid through various strategies.
         
+        Results are cached per word. The dictionary lookups behind a result
+        are counted in the checker's stem_match_stats on every call, so its
+        totals match an uncached run. The returned details dict is shared
+        between calls for the same word and must not be modified.
+        
         Args:
             word: The hyphenated word to check
             
@@ -28,8 +53,32 @@ class HyphenatedWordHandler:
             match_type: 'whole', 'components', 'dehyphenated', 'stem_components', 'none'
             details: Dictionary with validation details
         """
+        result, stats_keys = self.match_hyphenated_word(word)
+        self.checker._count_matches(stats_keys)
+        return result
+    
+    def match_hyphenated_word(self, word: str) -> Tuple[Tuple[bool, str, Dict], Tuple[str, ...]]:
+        """Check a word like is_valid_hyphenated_word, without touching stem_match_stats.
+        
+        Returns:
+            Tuple of (result, stats_keys), where result is what
+            is_valid_hyphenated_word returns and stats_keys holds the
+            stem_match_stats entry of every dictionary lookup made
+        """
+        results = self._results
+        cached = results.get(word)
+        if cached is None:
+            if len(results) >= _RESULT_CACHE_SIZE:
+                # Starting over is cheaper than tracking recency, and the
+                # common words are cached again right away
+                results.clear()
+            cached = results[word] = self._validate(word)
+        return cached
+    
+    def _validate(self, word: str) -> Tuple[Tuple[bool, str, Dict], Tuple[str, ...]]:
+        """Run the validation strategies for match_hyphenated_word."""
         if '-' not in word:
-            return (False, 'none', {'reason': 'not_hyphenated'})
+            return (False, 'none', {'reason': 'not_hyphenated'}), ()
         
         details = {
             'original': word,
@@ -38,71 +87,82 @@ class HyphenatedWordHandler:
             'invalid_components': []
         }
         
+        # Lowercase once up front; the lookups below pass lowercase forms with
+        # case_sensitive=True so match_word doesn't lowercase them again
+        word_lower = word.lower()
+        match_word = self.checker.match_word
+        # stem_match_stats entry of each lookup, counted by the caller
+        stats_keys = []
+        
         # Strategy 1: Check if whole word is in dictionary
-        found, match_type = self.checker.is_in_dictionary(word, allow_hyphenated=False)
+        found, match_type, keys = match_word(word_lower, case_sensitive=True, allow_hyphenated=False)
+        stats_keys += keys
         if found:
-            return (True, 'whole', details)
+            return (True, 'whole', details), tuple(stats_keys)
         
         # Strategy 2: Check as dehyphenated word (remove hyphens)
         dehyphenated = word.replace('-', '')
         if dehyphenated and dehyphenated.isalpha():
-            found, match_type = self.checker.is_in_dictionary(dehyphenated, allow_hyphenated=False)
+            found, match_type, keys = match_word(word_lower.replace('-', ''), case_sensitive=True, allow_hyphenated=False)
+            stats_keys += keys
             if found:
                 details['dehyphenated'] = dehyphenated
-                return (True, 'dehyphenated', details)
+                return (True, 'dehyphenated', details), tuple(stats_keys)
         
         # Strategy 3: Split and check individual components
         # Split on hyphens, filter out empty strings and non-alphabetic parts
-        components = [part.strip() for part in word.split('-') if part.strip()]
+        components = [part for part in map(str.strip, word.split('-')) if part]
+        components_lower = [part for part in map(str.strip, word_lower.split('-')) if part]
         details['components'] = components
         
         # Ignore if starts/ends with hyphen (likely OCR error)
         if word.startswith('-') or word.endswith('-'):
             details['reason'] = 'edge_hyphen_likely_ocr_error'
-            return (False, 'none', details)
+            return (False, 'none', details), tuple(stats_keys)
+        
+        # Which components are alphabetic, computed once for the checks below
+        alpha_mask = [part.isalpha() for part in components]
         
         # Ignore if any component is too short (single letter) - likely OCR error
-        if any(len(part) < 2 for part in components if part.isalpha()):
+        if any(is_alpha and len(part) < 2 for part, is_alpha in zip(components, alpha_mask)):
             details['reason'] = 'short_component_likely_ocr_error'
-            return (False, 'none', details)
+            return (False, 'none', details), tuple(stats_keys)
         
-        # Check each alphabetic component
+        # Strategies 3 and 4 in one pass: check each alphabetic component, and
+        # the stem of each invalid one (if stemmer available)
         valid_count = 0
-        for part in components:
-            if part.isalpha():
-                found, match_type = self.checker.is_in_dictionary(part, allow_hyphenated=False)
+        alphabetic_count = 0
+        stem_components = []
+        for part, part_lower, is_alpha in zip(components, components_lower, alpha_mask):
+            if is_alpha:
+                alphabetic_count += 1
+                found, match_type, keys = match_word(part_lower, case_sensitive=True, allow_hyphenated=False)
+                stats_keys += keys
                 if found:
                     details['valid_components'].append(part)
                     valid_count += 1
                 else:
                     details['invalid_components'].append(part)
+                    if self.stemmer:
+                        stem = self.stemmer.stem_token(part)
+                        found, match_type, keys = match_word(stem, allow_hyphenated=False)
+                        stats_keys += keys
+                        if found:
+                            stem_components.append({'original': part, 'stem': stem})
         
         # If all alphabetic components are valid, consider the whole word valid
-        alphabetic_components = [p for p in components if p.isalpha()]
-        if alphabetic_components and valid_count == len(alphabetic_components):
+        if alphabetic_count and valid_count == alphabetic_count:
             details['all_components_valid'] = True
-            return (True, 'components', details)
+            return (True, 'components', details), tuple(stats_keys)
         
-        # Strategy 4: Check stems of components (if stemmer available)
-        if self.stemmer and alphabetic_components:
-            stem_valid_count = 0
-            details['stem_components'] = []
-            
-            for part in alphabetic_components:
-                if part not in details['valid_components']:  # Only check invalid ones
-                    stem = self.stemmer.stem_token(part)
-                    found, match_type = self.checker.is_in_dictionary(stem, allow_hyphenated=False)
-                    if found:
-                        details['stem_components'].append({'original': part, 'stem': stem})
-                        stem_valid_count += 1
-            
-            # If all components are valid (either original or stem)
-            total_valid = valid_count + stem_valid_count
-            if total_valid == len(alphabetic_components):
+        # If all components are valid (either original or stem)
+        if self.stemmer and alphabetic_count:
+            details['stem_components'] = stem_components
+            if valid_count + len(stem_components) == alphabetic_count:
                 details['all_components_valid_via_stem'] = True
-                return (True, 'stem_components', details)
+                return (True, 'stem_components', details), tuple(stats_keys)
         
-        return (False, 'none', details)
+        return (False, 'none', details), tuple(stats_keys)
     
     def analyze_hyphenated_words(self, words: List[str]) -> Dict:
         """Analyze a list of hyphenated words.
@@ -171,7 +231,7 @@ def get_hyphenated_words_from_tokens(tokens: List[str]) -> List[str]:
     Returns:
         List of hyphenated words
     """
-    return [token for token in tokens if '-' in token and any(c.isalpha() for c in token)]
+    return [token for token in tokens if '-' in token and _has_letter(token)]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""JSON file helpers with an optional orjson fast path."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the standard library
+    orjson = None
+
+
+def dump_json(data: Any, path: str, indent: bool = True) -> None:
+    """Write data to a JSON file.
+
+    Uses orjson (allowing non-string keys) when it is installed, otherwise
+    the standard library encoder without pretty-printing, since indenting is
+    the slowest part of json.dump.
+
+    Args:
+        data: JSON-serializable object to write
+        path: Path of the output file
+        indent: Pretty-print with orjson; pass False for large files that
+            are only read back by the pipeline
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+
+def load_json(path: str) -> Any:
+    """Read a JSON file.
+
+    Uses orjson when it is installed, otherwise the standard library decoder.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        The decoded JSON data
+    """
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
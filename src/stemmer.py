@@ -3,7 +3,47 @@ from nltk.stem import PorterStemmer, SnowballStemmer
 from nltk.stem import WordNetLemmatizer
 from nltk.corpus import wordnet
 from typing import List, Dict, Tuple, Optional
+import functools
 import re
+import sys
+
+
+# Only alphabetic tokens are stemmed
+_ALPHA_RE = re.compile(r'^[a-zA-Z]+$')
+
+# Distinct lowercase tokens remembered by each of the Porter and Snowball
+# stem caches
+_STEM_CACHE_SIZE = 200000
+
+# Longest stem that is interned; interned strings stay alive for the rest
+# of the process, so long one-off stems are not interned
+_MAX_INTERN_LENGTH = 30
+
+# Token sequences whose POS tags are remembered. Each entry holds a whole
+# input (often a file's tokens), so only a few recent inputs are kept
+_POS_TAG_CACHE_SIZE = 32
+
+
+def _intern_short(text: str) -> str:
+    """Intern text of at most _MAX_INTERN_LENGTH characters."""
+    return sys.intern(text) if len(text) <= _MAX_INTERN_LENGTH else text
+
+
+# Stemmers shared by every TokenStemmer; they hold no per-call state
+_porter_stemmer = PorterStemmer()
+_snowball_stemmer = SnowballStemmer('english')
+
+
+@functools.lru_cache(maxsize=_STEM_CACHE_SIZE)
+def _cached_porter_stem(token: str) -> str:
+    """Porter-stem a lowercase token, memoized across all TokenStemmers."""
+    return _intern_short(_porter_stemmer.stem(token))
+
+
+@functools.lru_cache(maxsize=_STEM_CACHE_SIZE)
+def _cached_snowball_stem(token: str) -> str:
+    """Snowball-stem a lowercase token, memoized across all TokenStemmers."""
+    return _intern_short(_snowball_stemmer.stem(token))
 
 
 def ensure_stemmer_data():
@@ -25,6 +65,15 @@ def ensure_stemmer_data():
                 print(f"  Warning: Could not download {name}")
 
 
+@functools.lru_cache(maxsize=_POS_TAG_CACHE_SIZE)
+def _cached_pos_tag(tokens: Tuple[str, ...]) -> Tuple[Tuple[str, str], ...]:
+    """POS-tag a token sequence, memoized for inputs that are tagged again.
+    
+    Returns a tuple so the cached tags can't be modified by callers.
+    """
+    return tuple(nltk.pos_tag(list(tokens)))
+
+
 def get_wordnet_pos(treebank_tag):
     """Convert treebank POS tag to WordNet POS tag.
     
@@ -57,10 +106,16 @@ class TokenStemmer:
         """
         self.method = method
         
+        # Stemming is deterministic per lowercase token, and tokens repeat
+        # heavily, so stems come from module-level caches shared by every
+        # instance; short stems are interned so words sharing a stem share
+        # one string
         if method == 'porter':
-            self.stemmer = PorterStemmer()
+            self.stemmer = _porter_stemmer
+            self._stem = _cached_porter_stem
         elif method == 'snowball':
-            self.stemmer = SnowballStemmer('english')
+            self.stemmer = _snowball_stemmer
+            self._stem = _cached_snowball_stem
         elif method == 'lemmatize':
             ensure_stemmer_data()
             self.lemmatizer = WordNetLemmatizer()
@@ -78,13 +133,13 @@ class TokenStemmer:
             Stemmed/lemmatized form of the token
         """
         # Only stem alphabetic tokens
-        if not re.match(r'^[a-zA-Z]+$', token):
+        if not _ALPHA_RE.match(token):
             return token.lower()
         
         token_lower = token.lower()
         
         if self.method in ['porter', 'snowball']:
-            return self.stemmer.stem(token_lower)
+            return self._stem(token_lower)
         elif self.method == 'lemmatize':
             if pos_tag:
                 wordnet_pos = get_wordnet_pos(pos_tag)
@@ -107,22 +162,17 @@ class TokenStemmer:
         pos_tags = None
         if self.method == 'lemmatize':
             try:
-                pos_tags = nltk.pos_tag(tokens)
+                pos_tags = _cached_pos_tag(tuple(tokens))
             except:
                 print("Warning: POS tagging failed, using default POS")
         
-        results = []
-        for i, token in enumerate(tokens):
-            pos_tag = pos_tags[i][1] if pos_tags else None
-            stem = self.stem_token(token, pos_tag)
-            
-            results.append({
-                'original': token,
-                'stem': stem,
-                'pos': pos_tag if pos_tags else None
-            })
-        
-        return results
+        stem = self.stem_token
+        if pos_tags:
+            return [
+                {'original': token, 'stem': stem(token, pos_tag), 'pos': pos_tag}
+                for token, (_, pos_tag) in zip(tokens, pos_tags)
+            ]
+        return [{'original': token, 'stem': stem(token), 'pos': None} for token in tokens]
     
     def stem_tokens_simple(self, tokens: List[str]) -> List[Tuple[str, str]]:
         """Stem tokens and return simple (original, stem) tuples.
@@ -137,17 +187,14 @@ class TokenStemmer:
         pos_tags = None
         if self.method == 'lemmatize':
             try:
-                pos_tags = nltk.pos_tag(tokens)
+                pos_tags = _cached_pos_tag(tuple(tokens))
             except:
                 pass
         
-        results = []
-        for i, token in enumerate(tokens):
-            pos_tag = pos_tags[i][1] if pos_tags else None
-            stem = self.stem_token(token, pos_tag)
-            results.append((token, stem))
-        
-        return results
+        stem = self.stem_token
+        if pos_tags:
+            return [(token, stem(token, pos_tag)) for token, (_, pos_tag) in zip(tokens, pos_tags)]
+        return [(token, stem(token)) for token in tokens]
 
 
 def get_stem_statistics(stemmed_data: List[Dict[str, str]]) -> Dict:
@@ -1,11 +1,22 @@
 import os
-from typing import List, Set, Optional, Dict
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, FrozenSet, Optional, Dict
 
 from lxml import etree
 
 
+# Namespace of the BITS book XML, and the section tag in Clark notation
+BITS_NAMESPACE = 'https://jats.nlm.nih.gov/extensions/bits/2.1/xsd/BITS-book2-1.xsd'
+_SEC_TAG = f'{{{BITS_NAMESPACE}}}sec'
+
+# Compiled once instead of resolving the namespace and path on every call
+_NAMESPACES = {'bits': BITS_NAMESPACE}
+_YEAR_XPATH = etree.XPath('.//bits:year', namespaces=_NAMESPACES)
+_MONTH_XPATH = etree.XPath('.//bits:month', namespaces=_NAMESPACES)
+
 # Metadata elements to exclude from text extraction
-EXCLUDED_ELEMENTS: Set[str] = {
+EXCLUDED_ELEMENTS: FrozenSet[str] = frozenset({
     'processing-meta',
     'collection-meta',
     'book-meta',
@@ -18,30 +29,54 @@ EXCLUDED_ELEMENTS: Set[str] = {
     'day',
     'month',
     'year',
-}
+})
 
 
 def extract_text_from_element(elem: etree._Element) -> str:
-    """Recursively extract and join text content from an element and its children.
+    """Extract and join text content from an element and its children.
 
     Skips metadata elements defined in EXCLUDED_ELEMENTS.
     Preserves whitespace between sibling text nodes.
+
+    Walks the tree iteratively with lxml.etree.iterwalk; each element's text
+    is joined and stripped when the element ends, as a recursive join would.
+    Comments and processing instructions contribute only their tail.
     """
-    # Get the local name (without namespace)
-    local_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
+    # One list of text parts per open element; the root's result ends up in
+    # the bottom entry
+    stack: List[List[str]] = [[]]
+    skip_depth = 0
+    excluded = EXCLUDED_ELEMENTS
     
-    # Skip this element entirely if it's metadata
-    if local_name in EXCLUDED_ELEMENTS:
-        return ""
+    for event, el in etree.iterwalk(elem, events=('start', 'end', 'comment', 'pi')):
+        if event in ('comment', 'pi'):
+            if not skip_depth and el.tail:
+                stack[-1].append(el.tail)
+            continue
+        
+        if event == 'start':
+            # Skip metadata elements and everything inside them
+            if skip_depth or el.tag.rpartition('}')[2] in excluded:
+                skip_depth += 1
+            else:
+                stack.append([el.text] if el.text else [])
+            continue
+        
+        if skip_depth:
+            skip_depth -= 1
+            if skip_depth:
+                continue
+            # A skipped element contributes only its tail
+            text = ""
+        else:
+            text = "".join(stack.pop()).strip()
+        
+        parts = stack[-1]
+        parts.append(text)
+        if el is not elem and el.tail:
+            parts.append(el.tail)
     
-    parts: List[str] = []
-    if elem.text:
-        parts.append(elem.text)
-    for child in elem:
-        parts.append(extract_text_from_element(child))
-        if child.tail:
-            parts.append(child.tail)
-    return "".join(parts).strip()
+    return stack[0][0]
 
 
 def parse_xml_file_to_text(path: str) -> str:
@@ -50,7 +85,7 @@ def parse_xml_file_to_text(path: str) -> str:
     Uses lxml.etree for robust parsing. Returns an empty string on parse errors.
     """
     try:
-        parser = etree.XMLParser(recover=True)
+        parser = etree.XMLParser(recover=True, huge_tree=True)
         tree = etree.parse(path, parser)
         root = tree.getroot()
         text = extract_text_from_element(root)
@@ -65,16 +100,13 @@ def extract_date_from_section(sec_elem: etree._Element) -> Optional[str]:
     
     Returns date in 'yyyy-mm' format or None if not found.
     """
-    # Look for date elements in sec-meta
-    namespaces = {'bits': 'https://jats.nlm.nih.gov/extensions/bits/2.1/xsd/BITS-book2-1.xsd'}
-    
     # Try to find year and month in the metadata
-    year_elem = sec_elem.find('.//bits:year', namespaces)
-    month_elem = sec_elem.find('.//bits:month', namespaces)
+    year_elems = _YEAR_XPATH(sec_elem)
+    month_elems = _MONTH_XPATH(sec_elem)
     
-    if year_elem is not None and month_elem is not None:
-        year = year_elem.text
-        month = month_elem.text
+    if year_elems and month_elems:
+        year = year_elems[0].text
+        month = month_elems[0].text
         if year and month:
             # Ensure month is zero-padded
             month_str = month.zfill(2)
@@ -90,33 +122,49 @@ def parse_xml_to_articles(path: str) -> List[Dict[str, str]]:
     - 'id': section ID
     - 'date': yyyy-mm format (or empty string)
     - 'text': plain text content
+    
+    Sections are streamed with lxml.etree.iterparse and freed once read, so
+    only one top-level section of the document is held in memory at a time.
     """
     try:
-        parser = etree.XMLParser(recover=True)
-        tree = etree.parse(path, parser)
-        root = tree.getroot()
-        
-        # Find all section elements
-        namespaces = {'bits': 'https://jats.nlm.nih.gov/extensions/bits/2.1/xsd/BITS-book2-1.xsd'}
-        sections = root.findall('.//bits:sec', namespaces)
-        
         articles = []
-        for sec in sections:
-            # Extract section ID
-            sec_id = sec.get('id', '')
+        # Articles of the open top-level section and its nested sections,
+        # kept in document order; a section is only complete at its end tag
+        pending: List[Optional[Dict[str, str]]] = []
+        open_slots: List[int] = []
+        
+        for event, sec in etree.iterparse(path, events=('start', 'end'), tag=_SEC_TAG,
+                                          recover=True, huge_tree=True):
+            if event == 'start':
+                open_slots.append(len(pending))
+                pending.append(None)
+                continue
+            
+            # Extract section ID (short strings like these are interned;
+            # dates repeat across many sections)
+            sec_id = sys.intern(sec.get('id', ''))
             
             # Extract date
-            date_str = extract_date_from_section(sec) or ''
+            date_str = sys.intern(extract_date_from_section(sec) or '')
             
             # Extract text
             text = extract_text_from_element(sec)
             
             if text:  # Only include sections with actual content
-                articles.append({
+                pending[open_slots[-1]] = {
                     'id': sec_id,
                     'date': date_str,
                     'text': text
-                })
+                }
+            open_slots.pop()
+            
+            if not open_slots:
+                articles.extend(article for article in pending if article is not None)
+                pending.clear()
+                # Drop the finished section and anything parsed before it
+                sec.clear()
+                while sec.getprevious() is not None:
+                    del sec.getparent()[0]
         
         return articles
     except Exception:
@@ -129,6 +177,11 @@ def save_articles_to_files(articles: List[Dict[str, str]], output_dir: str) -> i
     Filenames use pattern: {date}_{id}.txt or just {id}.txt if no date.
     Creates output_dir if it doesn't exist.
     
+    Duplicate names are not detected: an article whose filename already
+    exists overwrites it, so when several XML files produce the same name
+    the one saved last wins. Save the files of a run in a fixed order
+    (see the __main__ block) to keep the output reproducible.
+    
     Returns count of files written.
     """
     if not articles:
@@ -167,22 +220,28 @@ def process_xml_to_output(xml_path: str, output_dir: str) -> int:
     return save_articles_to_files(articles, output_dir)
 
 
-def parse_docs_directory_to_texts(docs_dir: str, recursive: bool = True) -> List[tuple]:
+def parse_docs_directory_to_texts(docs_dir: str, recursive: bool = True,
+                                  max_workers: int = 1) -> List[tuple]:
     """Find XML files under `docs_dir` and return list of (filename, text).
 
     Behavior:
     - Walks the directory recursively (if recursive=True) or non-recursively.
     - Only files ending with .xml (case-insensitive) are processed.
     - Returns an empty list if docs_dir doesn't exist or contains no xml files.
+    - With max_workers > 1, files are parsed in parallel worker processes;
+      results keep walk order either way.
     
     Args:
         docs_dir: Directory to search for XML files
         recursive: If True, search subdirectories recursively
+        max_workers: Number of parsing processes (default: 1, which parses
+            every file in this process)
     """
     if not os.path.isdir(docs_dir):
         return []
 
-    results: List[tuple] = []
+    # (name, path) pairs for every XML file to parse
+    entries: List[tuple] = []
     
     if recursive:
         # Recursively walk through all subdirectories
@@ -191,10 +250,9 @@ def parse_docs_directory_to_texts(docs_dir: str, recursive: bool = True) -> List
                 if not name.lower().endswith('.xml'):
                     continue
                 path = os.path.join(root, name)
-                text = parse_xml_file_to_text(path)
                 # Use relative path from docs_dir for the filename
                 rel_path = os.path.relpath(path, docs_dir)
-                results.append((rel_path, text))
+                entries.append((rel_path, path))
     else:
         # Only process files directly under docs_dir
         for name in os.listdir(docs_dir):
@@ -203,10 +261,17 @@ def parse_docs_directory_to_texts(docs_dir: str, recursive: bool = True) -> List
             path = os.path.join(docs_dir, name)
             if not os.path.isfile(path):
                 continue
-            text = parse_xml_file_to_text(path)
-            results.append((name, text))
+            entries.append((name, path))
 
-    return results
+    paths = [path for _, path in entries]
+    if max_workers > 1 and len(paths) > 1:
+        # Each file is independent and parsing is CPU-bound
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            texts = list(executor.map(parse_xml_file_to_text, paths, chunksize=4))
+    else:
+        texts = [parse_xml_file_to_text(path) for path in paths]
+
+    return [(name, text) for (name, _), text in zip(entries, texts)]
 
 
 if __name__ == "__main__":
@@ -216,23 +281,27 @@ if __name__ == "__main__":
     docs = os.path.join(project_root, 'docs')
     output = os.path.join(project_root, 'output')
     
-    # Process all XML files in docs directory (recursively)
-    total_files = 0
-    xml_count = 0
+    # Collect all XML files in docs directory (recursively)
+    xml_paths = [
+        os.path.join(root, name)
+        for root, dirs, files in os.walk(docs)
+        for name in files
+        if name.lower().endswith('.xml')
+    ]
     
-    for root, dirs, files in os.walk(docs):
-        for name in files:
-            if not name.lower().endswith('.xml'):
-                continue
-            xml_path = os.path.join(root, name)
-            xml_count += 1
-            
+    # Parse the XML files in parallel; each one is independent. Articles are
+    # written here in walk order, so a name produced by several files always
+    # ends up with the same (last) file's text
+    total_files = 0
+    with ProcessPoolExecutor() as executor:
+        article_lists = executor.map(parse_xml_to_articles, xml_paths, chunksize=4)
+        for xml_path, articles in zip(xml_paths, article_lists):
+            count = save_articles_to_files(articles, output)
             # Show relative path for clarity
             rel_path = os.path.relpath(xml_path, docs)
-            print(f"Processing {rel_path}...")
-            count = process_xml_to_output(xml_path, output)
+            print(f"Processed {rel_path}")
             total_files += count
             print(f"  Created {count} article files")
     
-    print(f"\nProcessed {xml_count} XML file(s)")
+    print(f"\nProcessed {len(xml_paths)} XML file(s)")
     print(f"Total: {total_files} article files written to {output}")